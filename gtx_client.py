@@ -0,0 +1,155 @@
+"""
+구글 번역 경량 클라이언트 모듈
+translate.googleapis.com의 client=gtx 엔드포인트를 직접 호출하는 얇은 래퍼
+"""
+
+import json
+
+import httpx
+
+
+GTX_TRANSLATE_URL = "https://translate.googleapis.com/translate_a/single"
+
+
+class GtxTranslated:
+    """번역 결과 (googletrans.models.Translated와 같은 속성 제공)"""
+    
+    def __init__(self, src: str, dest: str, origin: str, text: str):
+        self.src = src
+        self.dest = dest
+        self.origin = origin
+        self.text = text
+    
+    def __repr__(self):
+        return f"GtxTranslated(src={self.src}, dest={self.dest}, text={self.text})"
+
+
+class GtxDetected:
+    """언어 감지 결과 (googletrans.models.Detected와 같은 속성 제공)"""
+    
+    def __init__(self, lang: str, confidence: float):
+        self.lang = lang
+        self.confidence = confidence
+    
+    def __repr__(self):
+        return f"GtxDetected(lang={self.lang}, confidence={self.confidence})"
+
+
+class GtxTranslator:
+    """
+    googletrans.Translator 대체용 경량 번역 클라이언트
+    
+    googletrans는 RPC 응답을 순수 Python 코드로 한 글자씩 해석하므로
+    여러 스레드에서 동시에 요청할 때 GIL을 오래 점유합니다.
+    gtx 엔드포인트는 일반 JSON을 돌려주므로 json 모듈(C 구현)로 바로 해석하고,
+    나머지 시간은 소켓 대기(GIL 해제 상태)로 보냅니다.
+    """
+    
+    def __init__(self, timeout=None, pool_limits=None):
+        """
+        클라이언트 초기화
+        
+        Args:
+            timeout: httpx 타임아웃 설정 (None이면 httpx 기본값)
+            pool_limits: httpx 연결 풀 크기 설정 (None이면 httpx 기본값)
+        """
+        self.timeout = timeout
+        self.pool_limits = pool_limits
+        self.client = httpx.Client(**self._client_options())
+        self._async_client = None  # 비동기 요청용 클라이언트 (이벤트 루프 안에서 처음 사용할 때 생성)
+    
+    def _client_options(self) -> dict:
+        """httpx 클라이언트 생성 옵션 (지정하지 않은 설정은 httpx 기본값 사용)"""
+        options = {}
+        if self.timeout is not None:
+            options['timeout'] = self.timeout
+        if self.pool_limits is not None:
+            options['pool_limits'] = self.pool_limits
+        return options
+    
+    def translate(self, text: str, dest: str = 'ko', src: str = 'auto') -> GtxTranslated:
+        """
+        문자열 번역 (googletrans.Translator.translate와 같은 호출 방식)
+        
+        Args:
+            text: 번역할 문자열
+            dest: 번역 대상 언어 코드
+            src: 원본 언어 코드 ('auto'면 자동 감지)
+        
+        Returns:
+            번역 결과 (text, src 속성 포함)
+        """
+        params = {'client': 'gtx', 'sl': src, 'tl': dest, 'dt': 't'}
+        # 긴 문자열도 URL 길이 제한에 걸리지 않도록 본문(POST)으로 전송
+        response = self.client.post(GTX_TRANSLATE_URL, params=params, data={'q': text})
+        return self._parse_response(response, text, dest, src)
+    
+    async def translate_async(self, text: str, dest: str = 'ko', src: str = 'auto') -> GtxTranslated:
+        """
+        문자열 번역 (비동기, 이벤트 루프 하나에서 여러 요청을 동시에 진행)
+        
+        Args:
+            text: 번역할 문자열
+            dest: 번역 대상 언어 코드
+            src: 원본 언어 코드 ('auto'면 자동 감지)
+            
+        Returns:
+            번역 결과 (text, src 속성 포함)
+        """
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(**self._client_options())
+        
+        params = {'client': 'gtx', 'sl': src, 'tl': dest, 'dt': 't'}
+        response = await self._async_client.post(GTX_TRANSLATE_URL, params=params, data={'q': text})
+        return self._parse_response(response, text, dest, src)
+    
+    def detect(self, text: str) -> GtxDetected:
+        """
+        문자열의 언어 감지 (googletrans.Translator.detect와 같은 호출 방식)
+        
+        Args:
+            text: 언어를 감지할 문자열
+            
+        Returns:
+            감지 결과 (lang, confidence 속성 포함, 신뢰도가 응답에 없으면 None)
+        """
+        params = {'client': 'gtx', 'sl': 'auto', 'tl': 'en', 'dt': 't'}
+        response = self.client.post(GTX_TRANSLATE_URL, params=params, data={'q': text})
+        response.raise_for_status()
+        
+        data = json.loads(response.text)
+        # data[2]: 감지된 언어, data[6]: 감지 신뢰도 (0~1)
+        lang = data[2] if len(data) > 2 and data[2] else 'auto'
+        confidence = data[6] if len(data) > 6 and isinstance(data[6], (int, float)) else None
+        return GtxDetected(lang=lang, confidence=confidence)
+    
+    def _parse_response(self, response, text: str, dest: str, src: str) -> GtxTranslated:
+        """
+        gtx 응답 해석
+        
+        Args:
+            response: httpx 응답
+            text: 원문
+            dest: 번역 대상 언어 코드
+            src: 요청한 원본 언어 코드
+            
+        Returns:
+            번역 결과
+        """
+        response.raise_for_status()
+        
+        data = json.loads(response.text)
+        # data[0]: [[번역문 조각, 원문 조각, ...], ...], data[2]: 감지된 원본 언어
+        translated = "".join(segment[0] for segment in data[0] or [] if segment[0])
+        detected_src = data[2] if len(data) > 2 and data[2] else src
+        return GtxTranslated(src=detected_src, dest=dest, origin=text, text=translated)
+    
+    def close(self):
+        """HTTP 연결 정리"""
+        self.client.close()
+    
+    async def aclose(self):
+        """비동기 HTTP 연결 정리 (클라이언트를 만든 이벤트 루프가 끝나기 전에 호출)"""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
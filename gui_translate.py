@@ -6,16 +6,21 @@
 import tkinter as tk
 from tkinter import filedialog, messagebox, scrolledtext, ttk
 import threading
+import queue
+from collections import deque
 import os
+import time
 import traceback
 import logging
 from datetime import datetime
-from translate_excel import ExcelTranslator
 from logger_config import setup_logger
 
 # 로거 설정 (기본값: INFO 레벨로 설정하여 성능 향상)
 logger = setup_logger("gui_translate", logging.INFO)
 
+# 진행 상황 창에 유지할 최대 줄 수 (오래된 줄은 삭제하여 Text 위젯 재배치 비용을 일정하게 유지)
+LOG_MAX_LINES = 1000
+
 
 class ExcelTranslateGUI:
     """엑셀 번역 GUI 클래스"""
@@ -37,8 +42,12 @@ class ExcelTranslateGUI:
         self.processed_cells = 0  # 처리된 셀 수
         self.progress_var = tk.DoubleVar()  # 진행률 변수 (0-100)
         self.translator_instance = None  # 번역기 인스턴스 참조 (중지용)
-        self.last_progress_time = None  # 마지막 진행률 업데이트 시간
-        self.last_progress_cells = 0  # 마지막 진행률 업데이트 시 셀 수
+        self.last_progress_time = None  # 마지막으로 남은 시간을 계산한 시각 (time.monotonic)
+        self.last_progress_cells = 0  # 마지막으로 남은 시간을 계산할 때의 셀 수
+        self._cells_per_second = None  # 처리 속도 지수 이동 평균 (셀/초)
+        self._remaining_time_str = ""  # 마지막으로 계산한 남은 시간 문자열
+        self._log_queue = queue.Queue()  # 로그 메시지 대기열 (번역 스레드 -> GUI)
+        self._progress_queue = queue.Queue()  # 진행률 대기열 (번역 스레드 -> GUI, 마지막 상태만 표시)
         
         # GUI 구성
         try:
@@ -48,8 +57,16 @@ class ExcelTranslateGUI:
             logger.error(f"GUI 위젯 생성 실패: {str(e)}", exc_info=True)
             raise
         
+        # 번역 모듈(pandas, openpyxl, googletrans)은 불러오는 데 0.5초 가량 걸리므로
+        # 창을 먼저 띄우고 백그라운드 스레드에서 미리 불러와 첫 번역 시작 시 지연이 없도록 함
+        threading.Thread(target=self._preload_translator_module, name="preload", daemon=True).start()
+        
         # 중앙 정렬
         self.center_window()
+        
+        # 로그/진행률 대기열 처리 시작 (100ms마다 모아서 표시)
+        self.root.after(100, self._drain_log_queue)
+        self.root.after(100, self._drain_progress_queue)
         logger.info("GUI 프로그램 초기화 완료")
     
     def center_window(self):
@@ -282,7 +299,12 @@ class ExcelTranslateGUI:
             messagebox.showerror("오류", f"파일 경로 선택 중 오류가 발생했습니다: {str(e)}")
     
     def log_message(self, message, level=logging.INFO):
-        """진행 상황 메시지 추가"""
+        """
+        진행 상황 메시지 추가
+        
+        메시지는 대기열에 넣기만 하고, 화면 표시는 _drain_log_queue에서 모아서 처리합니다.
+        (번역 스레드에서도 안전하게 호출 가능)
+        """
         try:
             timestamp = datetime.now().strftime("%H:%M:%S")
             formatted_message = f"[{timestamp}] {message}"
@@ -297,17 +319,60 @@ class ExcelTranslateGUI:
             else:
                 logger.info(message)
             
-            # GUI에 표시
-            self.progress_text.config(state=tk.NORMAL)
-            self.progress_text.insert(tk.END, formatted_message + "\n")
-            self.progress_text.see(tk.END)
-            self.progress_text.config(state=tk.DISABLED)
-            self.root.update_idletasks()
+            # GUI 표시는 대기열을 통해 메인 스레드에서 처리
+            self._log_queue.put(formatted_message)
         except Exception as e:
             logger.error(f"로그 메시지 추가 중 오류: {str(e)}", exc_info=True)
     
+    def _drain_log_queue(self):
+        """대기 중인 로그 메시지를 한 번에 표시 (100ms마다 실행, 최근 LOG_MAX_LINES줄만 유지)"""
+        messages = deque(maxlen=LOG_MAX_LINES)  # 어차피 잘려 나갈 오래된 메시지는 삽입하지 않음
+        try:
+            while True:
+                messages.append(self._log_queue.get_nowait())
+        except queue.Empty:
+            pass
+        
+        if messages:
+            try:
+                self.progress_text.config(state=tk.NORMAL)
+                self.progress_text.insert(tk.END, "\n".join(messages) + "\n")
+                # 마지막 빈 줄을 제외하고 LOG_MAX_LINES줄만 남기고 앞부분 삭제
+                self.progress_text.delete("1.0", f"end-{LOG_MAX_LINES + 1}l")
+                self.progress_text.see(tk.END)
+                self.progress_text.config(state=tk.DISABLED)
+            except Exception as e:
+                logger.error(f"로그 메시지 표시 중 오류: {str(e)}", exc_info=True)
+        
+        self.root.after(100, self._drain_log_queue)
+    
+    def _drain_progress_queue(self):
+        """대기 중인 진행률 중 마지막 상태만 표시 (100ms마다 실행)"""
+        last_progress = None
+        try:
+            while True:
+                last_progress = self._progress_queue.get_nowait()
+        except queue.Empty:
+            pass
+        
+        if last_progress is not None:
+            try:
+                self.update_progress(*last_progress)
+            except Exception as e:
+                logger.error(f"진행률 표시 중 오류: {str(e)}", exc_info=True)
+        
+        self.root.after(100, self._drain_progress_queue)
+    
     def clear_log(self):
         """로그 영역 초기화"""
+        # 아직 표시되지 않은 메시지/진행률도 함께 제거
+        for pending_queue in (self._log_queue, self._progress_queue):
+            try:
+                while True:
+                    pending_queue.get_nowait()
+            except queue.Empty:
+                pass
+        
         self.progress_text.config(state=tk.NORMAL)
         self.progress_text.delete(1.0, tk.END)
         self.progress_text.config(state=tk.DISABLED)
@@ -333,30 +398,13 @@ class ExcelTranslateGUI:
             self.progress_var.set(progress_percent)
             self.progress_percent_label.config(text=f"{progress_percent:.1f}%")
             
-            # 예상 남은 시간 계산
-            remaining_time_str = ""
-            if self.start_time and current > 0:
-                elapsed_time = (datetime.now() - self.start_time).total_seconds()
-                
-                # 처리 속도 계산 (셀/초)
-                if elapsed_time > 0:
-                    cells_per_second = current / elapsed_time
-                    remaining_cells = total - current
-                    
-                    if cells_per_second > 0 and remaining_cells > 0:
-                        remaining_seconds = remaining_cells / cells_per_second
-                        
-                        # 시간 포맷팅
-                        if remaining_seconds < 60:
-                            remaining_time_str = f"약 {int(remaining_seconds)}초 남음"
-                        elif remaining_seconds < 3600:
-                            minutes = int(remaining_seconds // 60)
-                            seconds = int(remaining_seconds % 60)
-                            remaining_time_str = f"약 {minutes}분 {seconds}초 남음"
-                        else:
-                            hours = int(remaining_seconds // 3600)
-                            minutes = int((remaining_seconds % 3600) // 60)
-                            remaining_time_str = f"약 {hours}시간 {minutes}분 남음"
+            # 예상 남은 시간은 1초에 한 번만 다시 계산 (그 사이에는 마지막 문자열 재사용)
+            now = time.monotonic()
+            if current >= total:
+                self._remaining_time_str = ""
+            elif self.last_progress_time is not None and current > 0 and now - self.last_progress_time >= 1.0:
+                self._update_remaining_time(current, total, now)
+            remaining_time_str = self._remaining_time_str
             
             # 상세 정보 표시
             if detail:
@@ -381,8 +429,45 @@ class ExcelTranslateGUI:
             self.progress_var.set(0)
             self.progress_percent_label.config(text="0%")
             self.progress_detail_label.config(text=detail if detail else "대기 중...")
+    
+    def _update_remaining_time(self, current: int, total: int, now: float):
+        """
+        처리 속도(지수 이동 평균)로 예상 남은 시간 문자열 갱신
         
-        self.root.update_idletasks()
+        Args:
+            current: 현재 처리된 셀 수
+            total: 전체 셀 수
+            now: 현재 시각 (time.monotonic)
+        """
+        elapsed = now - self.last_progress_time
+        rate = (current - self.last_progress_cells) / elapsed
+        if self._cells_per_second is None:
+            # 첫 계산은 시작부터의 평균 속도로 시작
+            total_elapsed = (datetime.now() - self.start_time).total_seconds() if self.start_time else elapsed
+            self._cells_per_second = current / total_elapsed if total_elapsed > 0 else rate
+        else:
+            self._cells_per_second = 0.9 * self._cells_per_second + 0.1 * rate
+        self.last_progress_time = now
+        self.last_progress_cells = current
+        
+        remaining_cells = total - current
+        if self._cells_per_second <= 0 or remaining_cells <= 0:
+            self._remaining_time_str = ""
+            return
+        
+        remaining_seconds = remaining_cells / self._cells_per_second
+        
+        # 시간 포맷팅
+        if remaining_seconds < 60:
+            self._remaining_time_str = f"약 {int(remaining_seconds)}초 남음"
+        elif remaining_seconds < 3600:
+            minutes = int(remaining_seconds // 60)
+            seconds = int(remaining_seconds % 60)
+            self._remaining_time_str = f"약 {minutes}분 {seconds}초 남음"
+        else:
+            hours = int(remaining_seconds // 3600)
+            minutes = int((remaining_seconds % 3600) // 60)
+            self._remaining_time_str = f"약 {hours}시간 {minutes}분 남음"
     
     def start_translation(self):
         """번역 시작"""
@@ -421,8 +506,10 @@ class ExcelTranslateGUI:
             self.is_translating = True
             self.should_stop = False  # 중지 플래그 초기화
             self.start_time = datetime.now()
-            self.last_progress_time = datetime.now()
+            self.last_progress_time = time.monotonic()
             self.last_progress_cells = 0
+            self._cells_per_second = None
+            self._remaining_time_str = ""
             self.translate_btn.config(state=tk.DISABLED, text="번역 중...")
             self.stop_btn.config(state=tk.NORMAL)  # 중지 버튼 활성화
             self.clear_log()
@@ -474,10 +561,12 @@ class ExcelTranslateGUI:
             
             # 진행률 콜백 함수 정의
             def update_progress_callback(current, total, detail=""):
-                """진행률 업데이트 콜백"""
-                self.root.after(0, lambda: self.update_progress(current, total, detail))
+                """진행률 업데이트 콜백 (대기열에 넣기만 하고 표시는 _drain_progress_queue에서 처리)"""
+                self._progress_queue.put((current, total, detail))
             
             # 번역기 초기화 (진행률 콜백 전달)
+            # (모듈은 창을 띄운 직후 미리 불러오므로 보통 여기서는 바로 반환됨)
+            from translate_excel import ExcelTranslator
             logger.debug("번역기 인스턴스 생성 시작")
             translator = ExcelTranslator(
                 debug_mode=False,  # 성능 향상을 위해 기본값 False
@@ -506,9 +595,9 @@ class ExcelTranslateGUI:
                 ))
                 return
             
-            # 완료 시 진행률 100%로 설정
-            self.root.after(0, lambda: self.update_progress(
-                translator.total_cells, 
+            # 완료 시 진행률 100%로 설정 (대기 중인 이전 진행률보다 나중에 표시되도록 같은 대기열 사용)
+            self._progress_queue.put((
+                translator.total_cells,
                 translator.total_cells_to_process if translator.total_cells_to_process > 0 else translator.total_cells,
                 "번역 완료!"
             ))
@@ -570,6 +659,14 @@ class ExcelTranslateGUI:
             ))
             logger.debug("번역 스레드 종료")
     
+    def _preload_translator_module(self):
+        """번역 모듈 미리 불러오기 (백그라운드 스레드에서 실행, 실패하면 번역 시작 시 다시 시도)"""
+        try:
+            import translate_excel  # noqa: F401
+            logger.debug("번역 모듈 불러오기 완료")
+        except Exception as e:
+            logger.error(f"번역 모듈 불러오기 실패: {str(e)}", exc_info=True)
+    
     def translate_text_with_log(self, translator, text):
         """텍스트 번역 (로깅 포함) - GUI에서는 translate_excel의 메서드 사용"""
         # translate_excel.py의 translate_text 메서드를 직접 사용
@@ -3,10 +3,26 @@
 디버깅을 위한 상세한 로깅 시스템
 """
 
+import atexit
 import logging
 import os
+import queue
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+
+# 로거별 백그라운드 기록 스레드 (같은 이름으로 다시 설정하면 이전 것을 멈춤)
+_listeners = {}
+
+
+def _stop_listeners():
+    """프로그램 종료 시 대기 중인 로그를 모두 기록하고 기록 스레드 종료"""
+    for listener in _listeners.values():
+        listener.stop()
+    _listeners.clear()
+
+
+atexit.register(_stop_listeners)
 
 
 def setup_logger(name: str = "excel_translate", log_level: int = logging.DEBUG) -> logging.Logger:
@@ -20,6 +36,11 @@ def setup_logger(name: str = "excel_translate", log_level: int = logging.DEBUG)
     Returns:
         설정된 로거 객체
     """
+    # 레코드마다 수집하는 스레드/프로세스 정보는 포맷에서 쓰지 않으므로 수집 생략
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    
     # 로거 생성
     logger = logging.getLogger(name)
     logger.setLevel(log_level)
@@ -27,6 +48,8 @@ def setup_logger(name: str = "excel_translate", log_level: int = logging.DEBUG)
     # 기존 핸들러 제거 (중복 방지)
     if logger.handlers:
         logger.handlers.clear()
+    if name in _listeners:
+        _listeners.pop(name).stop()
     
     # 로그 디렉토리 생성
     log_dir = "logs"
@@ -66,9 +89,13 @@ def setup_logger(name: str = "excel_translate", log_level: int = logging.DEBUG)
     file_handler.setFormatter(detailed_formatter)
     console_handler.setFormatter(simple_formatter)
     
-    # 핸들러 추가
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # 핸들러 추가: 로그를 호출한 스레드는 대기열에 넣기만 하고,
+    # 포맷팅과 파일/콘솔 쓰기는 백그라운드 스레드에서 처리 (번역 스레드가 디스크 I/O로 멈추지 않음)
+    log_queue = queue.Queue(-1)
+    logger.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    listener.start()
+    _listeners[name] = listener
     
     return logger
 
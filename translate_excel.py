@@ -6,34 +6,313 @@
 import pandas as pd
 import os
 import sys
+import asyncio
+import heapq
+import queue
+import random
+import re
+import sqlite3
+import threading
 from googletrans import Translator
-from typing import Union
 import time
-import traceback
 import logging
 from datetime import datetime, timedelta
 from logger_config import setup_logger
-from httpcore._exceptions import ReadTimeout
-from httpx import Timeout
-from openpyxl import load_workbook
+from gtx_client import GtxTranslator
+from translation_cache import LRUTranslationCache, TranslationCache
+from httpcore._exceptions import NetworkError, TimeoutException
+from httpx import PoolLimits, Timeout
+from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.utils import get_column_letter
 from copy import copy
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # 로거 설정 (기본값: INFO 레벨로 설정하여 성능 향상)
 # DEBUG 모드는 필요시 코드에서 직접 활성화
 logger = setup_logger("translate_excel", logging.INFO)
 
+# 여러 셀을 한 번의 요청으로 묶을 때 사용하는 구분자 (번역되지 않는 드문 기호)
+BATCH_DELIMITER = "◊◊◊"
+BATCH_SEPARATOR = f"\n{BATCH_DELIMITER}\n"
+BATCH_MAX_CHARS = 4500  # 구글 번역 요청당 최대 약 5000자
+BATCH_MAX_ITEMS = 100
+MAX_CONCURRENT_REQUESTS = 8  # 동시에 보내는 번역 요청 수 (스레드 풀 사용 시)
+MAX_CONCURRENT_ASYNC_REQUESTS = 32  # 동시에 보내는 번역 요청 수 (비동기 클라이언트 사용 시)
+PROGRESS_INTERVAL = 0.5  # 진행률 콜백 최소 간격 (초)
+WRITE_QUEUE_SIZE = 2  # 저장 대기 중인 번역 완료 시트 수 (메모리 사용량 제한)
+MAX_REQUESTS_PER_SECOND = 50  # 초당 최대 번역 요청 수 (오류가 나면 자동으로 낮춤)
+GOOGLETRANS_SERVICE_URLS = ['translate.google.com', 'translate.google.co.kr']  # googletrans 요청 주소
+MEMORY_CACHE_MAX_ENTRIES = 50000  # 메모리 번역 캐시 최대 항목 수 (넘치면 오래 안 쓴 항목부터 제거)
+LOW_CARDINALITY_RATIO = 0.1  # 고유값 수가 행 수의 이 비율 미만이면 고유값 단위로 처리
+RETRY_MAX_ATTEMPTS = 3  # 번역 요청 최대 시도 횟수 (일시적 오류일 때만 재시도)
+RETRY_BASE_DELAY = 1.0  # 첫 재시도 전 기본 대기 시간 (초, 시도마다 2배)
+RETRY_MAX_DELAY = 30.0  # 재시도 전 최대 대기 시간 (초)
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)  # 재시도할 HTTP 상태 코드
+SRC_DETECT_SAMPLE_SIZE = 20  # 원본 언어 감지에 사용할 문자열 수 (긴 문자열 우선)
+SRC_DETECT_MAX_CHARS = 500  # 원본 언어 감지 표본 최대 길이 (쿼리 문자열로 보내질 수 있어 URL 길이 제한보다 충분히 짧게)
+SRC_DETECT_MIN_CONFIDENCE = 0.5  # 감지 신뢰도가 이보다 낮으면 요청마다 자동 감지
+
+# 한글 음절 + 호환 자모 (처음 20자에 하나라도 있으면 이미 한국어로 보고 번역하지 않음)
+_HANGUL_RE = re.compile('[\uAC00-\uD7A3\u3131-\u3163]')
+
+# googletrans 오류 메시지의 HTTP 상태 코드 (raise_exception=True일 때)
+_STATUS_CODE_RE = re.compile(r'status code "(\d+)"')
+
+# 번역할 필요가 없는 문자열 (전체 일치 시 건너뜀)
+# 숫자/기호/공백으로만 된 값(금액, 전화번호, 날짜 문자열 등), URL, 이메일 주소
+_SKIP_RE = re.compile(
+    r'[\s\d\W]*'
+    r'|(?:https?://|www\.)\S+'
+    r'|[\w.+-]+@[\w-]+(?:\.[\w-]+)+'
+)
+
+
+class RateLimiter:
+    """
+    토큰 버킷 + AIMD 방식 요청 속도 제한기
+    
+    처음에는 최대 속도로 요청하다가 오류(429/5xx, 타임아웃 등)가 나면 속도를 절반으로 줄이고,
+    오류 없이 일정 시간이 지나면 10%씩 다시 올립니다. 번역 스레드 간에 공유됩니다.
+    """
+    
+    def __init__(self, rate: float = MAX_REQUESTS_PER_SECOND, min_rate: float = 1.0,
+                 increase_interval: float = 60.0):
+        """
+        속도 제한기 초기화
+        
+        Args:
+            rate: 초당 최대 요청 수 (시작 속도이자 상한)
+            min_rate: 초당 최소 요청 수 (오류가 계속되어도 이보다 낮추지 않음)
+            increase_interval: 속도를 다시 올리기 전 오류 없이 지나야 하는 시간 (초)
+        """
+        self.rate = rate
+        self.max_rate = rate
+        self.min_rate = min_rate
+        self.increase_interval = increase_interval
+        self.tokens = rate
+        self.last = time.monotonic()
+        self.last_adjust = self.last
+        self.lock = threading.Lock()
+    
+    def _take_token(self) -> float:
+        """
+        토큰 1개 사용 시도
+        
+        Returns:
+            0이면 토큰 사용 성공, 아니면 다시 시도하기 전 기다릴 시간 (초)
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.rate, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0
+            return (1 - self.tokens) / self.rate
+    
+    def acquire(self):
+        """요청 1건 분량의 토큰을 얻을 때까지 대기"""
+        while True:
+            wait_time = self._take_token()
+            if not wait_time:
+                return
+            time.sleep(wait_time)
+    
+    async def acquire_async(self):
+        """요청 1건 분량의 토큰을 얻을 때까지 대기 (이벤트 루프를 막지 않음)"""
+        while True:
+            wait_time = self._take_token()
+            if not wait_time:
+                return
+            await asyncio.sleep(wait_time)
+    
+    def on_success(self):
+        """요청 성공 보고 (오류 없이 increase_interval이 지났으면 속도 10% 증가)"""
+        with self.lock:
+            now = time.monotonic()
+            if self.rate < self.max_rate and now - self.last_adjust >= self.increase_interval:
+                self.rate = min(self.max_rate, self.rate * 1.1)
+                self.last_adjust = now
+    
+    def on_error(self):
+        """요청 실패 보고 (속도를 절반으로 감소)"""
+        with self.lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+            self.tokens = min(self.tokens, self.rate)
+            self.last_adjust = time.monotonic()
+            new_rate = self.rate
+        logger.warning(f"번역 요청 오류로 요청 속도 감소: 초당 {new_rate:.1f}건")
+
+
+def _sheet_to_dataframe(ws) -> pd.DataFrame:
+    """
+    워크시트의 값을 DataFrame으로 변환 (첫 행은 컬럼명)
+    
+    pd.read_excel과 같이 끝쪽의 빈 행/열은 제외하고 컬럼별 자료형을 추론합니다.
+    
+    Args:
+        ws: 워크시트 (openpyxl, 읽기 전용 또는 일반 모드)
+        
+    Returns:
+        시트 데이터 DataFrame
+    """
+    data = pd.DataFrame(ws.values)
+    if data.empty:
+        return pd.DataFrame()
+    
+    # 끝쪽의 빈 행/열 제거 (서식만 있는 셀 등)
+    filled = data.notna()
+    rows_with_data = filled.any(axis=1).to_numpy().nonzero()[0]
+    cols_with_data = filled.any(axis=0).to_numpy().nonzero()[0]
+    if len(rows_with_data) == 0:
+        return pd.DataFrame()
+    data = data.iloc[:rows_with_data[-1] + 1, :cols_with_data[-1] + 1]
+    
+    # 헤더 행을 빼고 나면 숫자/날짜 컬럼의 자료형을 다시 추론
+    df = data.iloc[1:].reset_index(drop=True).infer_objects()
+    df.columns = data.iloc[0].tolist()
+    return df
+
+
+def _has_formulas(ws) -> bool:
+    """
+    워크시트에 수식 셀이 있는지 확인
+    
+    Args:
+        ws: 워크시트 (openpyxl, 일반 모드)
+        
+    Returns:
+        수식 셀 포함 여부
+    """
+    return any(cell.data_type == 'f' for cell in ws._cells.values())
+
+
+def _is_recoverable(e: Exception) -> bool:
+    """
+    재시도하면 성공할 수 있는 일시적 오류인지 확인
+    
+    타임아웃/네트워크 오류와 429(요청 제한), 5xx(서버 오류) 응답만 재시도 대상입니다.
+    그 밖의 4xx 응답이나 응답 해석 실패는 다시 보내도 결과가 같으므로 바로 실패 처리합니다.
+    gtx 클라이언트는 httpx.HTTPError(response 속성 포함)를, googletrans는
+    상태 코드가 메시지에 들어간 Exception을 던집니다.
+    
+    Args:
+        e: 번역 요청 중 발생한 예외
+        
+    Returns:
+        일시적 오류 여부
+    """
+    if isinstance(e, (TimeoutException, NetworkError, ConnectionError, TimeoutError)):
+        return True
+    response = getattr(e, 'response', None)
+    if response is not None:
+        return response.status_code in RETRY_STATUS_CODES
+    match = _STATUS_CODE_RE.search(str(e))
+    return match is not None and int(match.group(1)) in RETRY_STATUS_CODES
+
+
+def _backoff_delay(attempt: int) -> float:
+    """
+    재시도 전 대기 시간 (지수 백오프 + 지터)
+    
+    동시에 실패한 요청들이 같은 순간에 다시 몰리지 않도록 대기 시간의 절반을 무작위로 줄입니다.
+    
+    Args:
+        attempt: 실패한 시도 번호 (0부터 시작)
+        
+    Returns:
+        대기 시간 (초)
+    """
+    return min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt) * (0.5 + random.random() * 0.5)
+
+
+# 메모리 번역 캐시는 프로세스 전체에서 공유 (GUI에서 같은 파일을 다시 번역하면 영구 캐시 조회도 생략)
+_shared_trans_cache = LRUTranslationCache(MEMORY_CACHE_MAX_ENTRIES)
+
+# 번역 클라이언트는 모듈 전체에서 공유 (GUI에서 번역을 다시 시작해도 HTTP 클라이언트/TLS 설정을 재사용)
+_shared_translators = {}  # {클라이언트 종류: 번역 클라이언트}
+_shared_translators_lock = threading.Lock()
+
+# 영구 번역 캐시도 파일 경로별로 하나만 열어 공유 (GUI에서 번역할 때마다 SQLite 연결이 새로 쌓이지 않도록)
+_shared_disk_caches = {}  # {캐시 파일 절대 경로: TranslationCache}
+_shared_disk_caches_lock = threading.Lock()
+
+
+def _get_shared_translator(use_gtx_client: bool):
+    """
+    공유 번역 클라이언트 반환 (처음 호출할 때 생성)
+    
+    모듈을 불러오기만 하는 경우(GUI 미리 불러오기 등)에는 HTTP 클라이언트를 만들지 않도록
+    모듈 로드 시점이 아니라 처음 필요할 때 만듭니다.
+    
+    Args:
+        use_gtx_client: True면 경량 gtx 클라이언트, False면 googletrans 클라이언트
+        
+    Returns:
+        번역 클라이언트 (GtxTranslator 또는 googletrans.Translator)
+    """
+    with _shared_translators_lock:
+        translator = _shared_translators.get(use_gtx_client)
+        if translator is None:
+            # 타임아웃 설정 (프록시 환경 고려하여 증가)
+            # connect_timeout: 연결 타임아웃, read_timeout: 읽기 타임아웃, write_timeout: 쓰기 타임아웃, pool_timeout: 풀 타임아웃
+            timeout = Timeout(
+                connect_timeout=10.0,
+                read_timeout=30.0,
+                write_timeout=10.0,
+                pool_timeout=5.0
+            )
+            if use_gtx_client:
+                # 응답 해석이 가벼워 동시 요청 시 GIL 경합이 적음
+                # 유지 연결 수를 동시 요청 수에 맞춰 요청마다 TCP/TLS 연결을 새로 맺지 않도록 함
+                # (httpx 기본값은 10개라 비동기 요청이 몰리면 나머지 연결은 매번 끊고 다시 연결)
+                translator = GtxTranslator(timeout=timeout,
+                                           pool_limits=PoolLimits(max_keepalive=MAX_CONCURRENT_ASYNC_REQUESTS))
+            else:
+                # 요청마다 서비스 주소 중 하나를 골라 보내므로 한쪽이 느릴 때 재시도가 분산됨
+                # raise_exception=True: 429 등 오류 응답을 해석 오류 대신 상태 코드가 담긴 예외로 받음
+                translator = Translator(service_urls=GOOGLETRANS_SERVICE_URLS, timeout=timeout,
+                                        raise_exception=True)
+                # googletrans 4.0.0rc1은 응답 상태 확인에서 raise_Exception(대문자 E, 라이브러리 오타)을 읽으므로
+                # 같이 설정하지 않으면 200이 아닌 응답이 AttributeError로 바뀌어 재시도 대상에서 빠짐
+                translator.raise_Exception = True
+            _shared_translators[use_gtx_client] = translator
+        return translator
+
+
+
+def _get_shared_disk_cache(cache_path: str) -> TranslationCache:
+    """
+    캐시 파일 경로별 공유 영구 번역 캐시 반환 (처음 호출할 때 열기)
+    
+    Args:
+        cache_path: SQLite 캐시 파일 경로
+        
+    Returns:
+        영구 번역 캐시 (열 수 없으면 sqlite3.Error 발생)
+    """
+    key = os.path.abspath(cache_path)
+    with _shared_disk_caches_lock:
+        disk_cache = _shared_disk_caches.get(key)
+        if disk_cache is None:
+            disk_cache = TranslationCache(cache_path)
+            _shared_disk_caches[key] = disk_cache
+        return disk_cache
 
 class ExcelTranslator:
     """엑셀 파일 번역 클래스"""
     
-    def __init__(self, debug_mode: bool = False, progress_callback=None):
+    def __init__(self, debug_mode: bool = False, progress_callback=None, use_gtx_client: bool = False,
+                 cache_path: str = "translations.db"):
         """
         번역기 초기화
         
         Args:
             debug_mode: 디버그 모드 활성화 여부
             progress_callback: 진행률 업데이트 콜백 함수 (current, total, detail) -> None
+            use_gtx_client: True면 googletrans 대신 경량 gtx 클라이언트 사용
+            cache_path: 번역 결과를 실행 간에 재사용할 SQLite 캐시 파일 경로 (None이면 사용 안 함)
         """
         logger.debug("ExcelTranslator 초기화 시작")
         self.debug_mode = debug_mode
@@ -41,16 +320,9 @@ class ExcelTranslator:
         self.progress_callback = progress_callback  # 진행률 콜백 함수
         
         try:
-            # 타임아웃 설정 (프록시 환경 고려하여 증가)
-            # connect_timeout: 연결 타임아웃, read_timeout: 읽기 타임아웃, write_timeout: 쓰기 타임아웃, pool_timeout: 풀 타임아웃
-            timeout = Timeout(
-                connect_timeout=10.0,
-                read_timeout=30.0,
-                write_timeout=10.0,
-                pool_timeout=5.0
-            )
-            self.translator = Translator(timeout=timeout)
-            logger.info("구글 번역 API 초기화 완료 (타임아웃: 연결 10초, 읽기 30초)")
+            self.translator = _get_shared_translator(use_gtx_client)
+            client_name = "gtx" if use_gtx_client else "googletrans"
+            logger.info(f"구글 번역 API 초기화 완료 ({client_name}, 타임아웃: 연결 10초, 읽기 30초)")
         except Exception as e:
             logger.error(f"번역기 초기화 실패: {str(e)}", exc_info=True)
             raise
@@ -60,8 +332,26 @@ class ExcelTranslator:
         self.skipped_count = 0  # 건너뛴 셀 수 (숫자, 빈 셀 등)
         self.total_cells = 0
         self.total_cells_to_process = 0  # 처리할 전체 셀 수 (진행률 계산용)
-        self.last_progress_update = datetime.now()  # 마지막 진행률 업데이트 시간 (성능 최적화용)
+        self._last_tick = 0.0  # 마지막으로 진행률 콜백을 호출한 시각 (time.monotonic)
+        self._prefetched_cells = 0  # 워크북 사전 번역 단계에서 번역이 끝난 문자열이 차지하는 셀 수 (진행률 계산용)
+        self._prefetch_failed = set()  # 워크북 사전 번역 단계에서 실패한 문자열 (시트별 단계에서 다시 요청하지 않음)
         self.should_stop = False  # 번역 중지 플래그
+        self.src_lang = 'auto'  # 원본 언어 코드 (워크북마다 한 번 감지, 'auto'면 요청마다 자동 감지)
+        self._trans_cache = _shared_trans_cache  # 메모리 번역 캐시 {원문: 번역문} (프로세스 전체 공유, LRU)
+        self._cache_hits = 0  # 캐시에서 바로 찾은 횟수
+        self._cache_misses = 0  # 캐시에 없어 API로 요청한 문자열 수
+        self._stats_lock = threading.Lock()  # 번역 스레드에서 카운터를 갱신할 때 사용
+        
+        # 영구 번역 캐시 (이전 실행이나 중지된 실행에서 번역한 문자열은 다시 요청하지 않음)
+        self._disk_cache = None
+        if cache_path:
+            try:
+                self._disk_cache = _get_shared_disk_cache(cache_path)
+                logger.info(f"번역 캐시 파일 사용: {cache_path}")
+            except sqlite3.Error as e:
+                logger.warning(f"번역 캐시 파일을 열 수 없어 캐시 없이 진행합니다: {str(e)}")
+        self._executor = None  # 번역 요청용 스레드 풀 (처음 사용할 때 생성)
+        self._rate_limiter = RateLimiter()  # 번역 요청 속도 제한기 (스레드 간 공유)
         
         logger.debug("ExcelTranslator 초기화 완료")
     
@@ -94,7 +384,7 @@ class ExcelTranslator:
         pattern_count = sum(1 for pattern in date_patterns if pattern in number_format_lower)
         return pattern_count >= 2
     
-    def _excel_date_to_string(self, serial_number: Union[int, float]) -> str:
+    def _excel_date_to_string(self, serial_number: float) -> str:
         """
         Excel 날짜 시리얼 번호를 날짜 문자열로 변환
         
@@ -115,6 +405,53 @@ class ExcelTranslator:
             logger.warning(f"날짜 변환 실패: {serial_number} - {str(e)}")
             return str(serial_number)
     
+    def _get_cached(self, text_str: str):
+        """
+        캐시에서 번역문 조회 (메모리 캐시 → 영구 캐시 순서)
+        
+        Args:
+            text_str: 원문
+            
+        Returns:
+            번역문 (캐시에 없으면 None)
+        """
+        cached = self._trans_cache.get(text_str)
+        if cached is None and self._disk_cache is not None:
+            cached = self._disk_cache.get(text_str)
+            if cached is not None:
+                self._trans_cache[text_str] = cached
+        return cached
+    
+    def _store_cached(self, translations: dict):
+        """
+        번역 결과를 메모리 캐시와 영구 캐시에 저장
+        
+        Args:
+            translations: {원문: 번역문} 딕셔너리
+        """
+        self._trans_cache.update(translations)
+        if self._disk_cache is not None:
+            self._disk_cache.put_many(translations)
+    
+    def _cacheable(self, translations: dict) -> dict:
+        """
+        캐시에 저장해도 되는 번역 결과만 고르기
+        
+        원본 언어를 고정해(src_lang) 보낸 요청에서 원문 그대로 돌아온 문자열은
+        다른 언어라서 번역되지 않았을 수 있으므로 저장하지 않습니다.
+        (그런 문자열은 _retry_unchanged에서 언어를 확인한 뒤 두 캐시에 함께 저장)
+        
+        Args:
+            translations: {원문: 번역문} 딕셔너리
+            
+        Returns:
+            저장할 {원문: 번역문} 딕셔너리
+        """
+        if self.src_lang == 'auto':
+            return translations
+        return {text_str: translated for text_str, translated in translations.items()
+                if translated.strip() != text_str}
+    
     def _translate_header_cell(self, text: str) -> str:
         """
         헤더 셀 전용 번역 메서드 (숫자 체크 건너뛰기)
@@ -133,253 +470,653 @@ class ExcelTranslator:
             text_str = text.strip()
             
             # 이미 한국어인지 체크
-            if any('\uAC00' <= char <= '\uD7A3' for char in text_str[:20]):
+            if _HANGUL_RE.search(text_str, 0, 20):
                 return text_str
             
+            # 캐시 확인 (여러 시트에 반복되는 헤더)
+            # (번역 스레드에서 동시에 호출되므로 카운터는 잠금 후 갱신)
+            cached = self._get_cached(text_str)
+            if cached is not None:
+                with self._stats_lock:
+                    self._cache_hits += 1
+                    self.translated_count += 1
+                return cached
+            with self._stats_lock:
+                self._cache_misses += 1
+            
             # 구글 번역 API 호출 (재시도 로직 포함)
-            translate_start = datetime.now()
+            translated_text = self._request_translation(text_str)
+            with self._stats_lock:
+                self.translated_count += 1
+            self._store_cached(self._cacheable({text_str: translated_text}))
             
-            # 재시도 로직 (최대 3회, 지수 백오프)
-            max_retries = 3
-            retry_delays = [1, 2, 4]  # 1초, 2초, 4초
-            result = None
-            last_exception = None
+            return translated_text
             
-            for attempt in range(max_retries):
-                try:
-                    result = self.translator.translate(text_str, dest='ko')
-                    break  # 성공 시 루프 종료
-                except ReadTimeout as e:
-                    last_exception = e
-                    if attempt < max_retries - 1:
-                        wait_time = retry_delays[attempt]
-                        logger.warning(
-                            f"헤더 번역 타임아웃 (시도 {attempt + 1}/{max_retries}): "
-                            f"'{text_str[:50]}...' - {wait_time}초 후 재시도"
-                        )
-                        time.sleep(wait_time)
-                    else:
-                        logger.error(
-                            f"헤더 번역 타임아웃 (최대 재시도 횟수 초과): '{text_str[:50]}...'"
-                        )
-                except Exception as e:
-                    last_exception = e
-                    if isinstance(e, (ConnectionError, TimeoutError)) and attempt < max_retries - 1:
-                        wait_time = retry_delays[attempt]
-                        logger.warning(
-                            f"헤더 네트워크 오류 (시도 {attempt + 1}/{max_retries}): "
-                            f"'{text_str[:50]}...' - {wait_time}초 후 재시도"
-                        )
-                        time.sleep(wait_time)
-                    else:
-                        raise
+        except Exception as e:
+            logger.error(f"헤더 번역 오류: {text_str[:50] if 'text_str' in locals() else str(text)[:50]}... - {str(e)}")
+            return text_str if 'text_str' in locals() else str(text)
+    
+    def _translate_headers(self, texts: list, prefetched: dict = None) -> dict:
+        """
+        헤더 문자열을 번역 스레드 풀에서 동시에 번역
+        
+        같은 헤더가 여러 컬럼에 있어도 한 번만 요청합니다.
+        
+        Args:
+            texts: 헤더 문자열 목록 (빈 문자열 제외, 중복 가능)
+            prefetched: 워크북 사전 번역 결과 {원문: 번역문} (있는 헤더는 요청하지 않음)
             
-            if result is None:
-                raise last_exception if last_exception else Exception("헤더 번역 실패")
+        Returns:
+            {헤더 문자열: 번역문} 딕셔너리 (번역 실패 시 원문)
+        """
+        translations = {}
+        failed = {}
+        pending = []
+        for text_str in dict.fromkeys(texts):
+            translated = prefetched.get(text_str.strip()) if prefetched else None
+            if translated is not None:
+                translations[text_str] = translated
+            elif text_str.strip() in self._prefetch_failed:
+                # 사전 번역에서 실패한 헤더는 다시 요청하지 않고 원문 유지
+                failed[text_str] = text_str.strip()
+            else:
+                pending.append(text_str)
+        with self._stats_lock:
+            self.translated_count += len(translations)
+        translations.update(failed)
+        
+        executor = self._get_executor()
+        futures = {
+            executor.submit(self._translate_header_cell, text_str): text_str
+            for text_str in pending
+        }
+        
+        try:
+            for future in as_completed(futures):
+                # 중지 플래그 확인
+                if self.should_stop:
+                    raise InterruptedError("번역이 사용자에 의해 중지되었습니다.")
+                translations[futures[future]] = future.result()
+        finally:
+            # 중지/오류 시 아직 시작하지 않은 요청 취소
+            for future in futures:
+                future.cancel()
+        
+        return translations
+    
+    def _text_column_positions(self, df: pd.DataFrame) -> list:
+        """
+        문자열이 들어 있을 수 있는 컬럼(object/string dtype)의 위치 목록 반환
+        
+        숫자/날짜 전용 컬럼은 문자열이 없으므로 번역 대상 선택 단계에 들어가지 않습니다.
+        중복 컬럼명이 있어도 안전하도록 컬럼 이름 대신 위치를 사용합니다.
+        
+        Args:
+            df: DataFrame
             
-            translate_duration = (datetime.now() - translate_start).total_seconds()
-            self.translated_count += 1
+        Returns:
+            문자열 컬럼의 위치(0부터 시작) 목록
+        """
+        text_dtypes = set(df.select_dtypes(include=['object', 'string']).dtypes)
+        return [col_idx for col_idx, dtype in enumerate(df.dtypes) if dtype in text_dtypes]
+    
+    def _translatable_mask(self, values: pd.Series) -> tuple:
+        """
+        값 목록에 번역 대상 조건을 벡터 연산으로 적용
+        
+        Args:
+            values: 문자열이 들어 있을 수 있는 Series
             
-            # googletrans는 무료 API이지만 과도한 딜레이는 불필요
-            time.sleep(0.01)
+        Returns:
+            (공백 제거된 값 배열, 번역 대상 여부 bool 배열, 한글 포함 여부 bool 배열) 튜플
+            (문자열이 없으면 (None, None, None))
+        """
+        try:
+            # 문자열이 아닌 값(숫자, 빈 셀 등)은 NaN이 됨
+            stripped = values.str.strip()
+        except AttributeError:
+            # 문자열이 하나도 없는 object 컬럼 (예: 불리언만 있는 컬럼)
+            return None, None, None
+        if not stripped.notna().any():
+            # 숫자/날짜가 섞인 object 컬럼은 strip 결과가 모두 NaN(float)이 되어 .str을 쓸 수 없음
+            return None, None, None
+        
+        hangul = stripped.str[:20].str.contains(_HANGUL_RE, na=False)
+        # 빈 문자열도 _SKIP_RE에 일치하므로 함께 걸러짐
+        skip = stripped.str.fullmatch(_SKIP_RE, na=False)
+        mask = stripped.notna() & ~hangul & ~skip
+        return stripped.to_numpy(dtype=object), mask.to_numpy(dtype=bool), hangul.to_numpy(dtype=bool)
+    
+    def _select_translatable(self, column: pd.Series) -> tuple:
+        """
+        컬럼에서 번역 대상 셀을 벡터 연산으로 선택
+        
+        문자열이고, 공백이 아니며, 처음 20자에 한글이 없고,
+        숫자/기호만으로 된 값이나 URL/이메일 주소가 아닌 셀만 선택합니다.
+        셀마다 파이썬 함수를 호출하지 않고 pandas 문자열 연산으로 한 번에 처리합니다.
+        반복값이 많은 컬럼(상태, 분류 등)은 고유값에만 문자열 연산을 적용합니다.
+        
+        Args:
+            column: 문자열 컬럼 Series (_text_column_positions로 고른 컬럼)
             
+        Returns:
+            (번역 대상 셀 위치 배열, 공백 제거된 문자열 목록, 이미 한국어라 건너뛴 셀 수) 튜플
+        """
+        # 고유값 코드로 변환 (빈 셀은 -1)
+        codes, uniques = pd.factorize(column)
+        
+        if len(uniques) < LOW_CARDINALITY_RATIO * len(column):
+            # 저카디널리티 컬럼: 고유값만 검사한 뒤 코드로 셀 위치에 되돌림
+            stripped, unique_mask, unique_hangul = self._translatable_mask(pd.Series(uniques, dtype=object))
+            if stripped is None:
+                return [], [], 0
+            valid_codes = codes[codes >= 0]
+            cell_mask = codes >= 0
+            cell_mask[cell_mask] = unique_mask[valid_codes]
+            positions = cell_mask.nonzero()[0]
+            hangul_count = int(unique_hangul[valid_codes].sum())
+            return positions, stripped[codes[positions]].tolist(), hangul_count
+        
+        stripped, mask, hangul = self._translatable_mask(column)
+        if stripped is None:
+            return [], [], 0
+        positions = mask.nonzero()[0]
+        return positions, stripped[positions].tolist(), int(hangul.sum())
+    
+    def _select_column_targets(self, df: pd.DataFrame, sheet_name: str = "") -> list:
+        """
+        DataFrame의 문자열 컬럼별 번역 대상 셀 선택 (숫자/날짜 전용 컬럼은 통째로 건너뜀)
+        
+        Args:
+            df: 대상 DataFrame
+            sheet_name: 시트 이름 (로깅용)
+            
+        Returns:
+            [(컬럼 위치, 셀 위치 배열, 문자열 목록, 한글이라 건너뛴 셀 수)] 목록
+        """
+        column_targets = []
+        for col_idx in self._text_column_positions(df):
+            # 중지 플래그 확인
+            if self.should_stop:
+                logger.warning(f"번역 중지 요청됨 (시트: {sheet_name}, 컬럼: {df.columns[col_idx]})")
+                raise InterruptedError("번역이 사용자에 의해 중지되었습니다.")
+            
+            column_targets.append((col_idx, *self._select_translatable(df.iloc[:, col_idx])))
+        return column_targets
+    
+    def _request_translation(self, text_str: str) -> str:
+        """
+        구글 번역 API 호출 (재시도 로직 포함)
+        
+        Args:
+            text_str: 번역할 문자열
+        
+        Returns:
+            번역된 텍스트 (한국어)
+        """
+        last_error = None
+        for attempt in range(RETRY_MAX_ATTEMPTS):
+            if last_error is not None:
+                time.sleep(self._retry_delay(attempt - 1, text_str, last_error))
+            self._rate_limiter.acquire()
+            try:
+                result = self.translator.translate(text_str, dest='ko', src=self.src_lang)
+            except Exception as e:
+                if not _is_recoverable(e):
+                    raise  # 다시 보내도 같은 오류이므로 즉시 전파
+                self._rate_limiter.on_error()
+                last_error = e
+                continue
+            self._rate_limiter.on_success()
+            return result.text
+        raise last_error  # 최대 재시도 횟수 초과 (호출하는 쪽에서 로깅)
+    
+    async def _request_translation_async(self, text_str: str) -> str:
+        """
+        구글 번역 API 비동기 호출 (재시도 로직 포함, translate_async를 지원하는 클라이언트 전용)
+        
+        Args:
+            text_str: 번역할 문자열
+        
+        Returns:
+            번역된 텍스트 (한국어)
+        """
+        last_error = None
+        for attempt in range(RETRY_MAX_ATTEMPTS):
+            if last_error is not None:
+                await asyncio.sleep(self._retry_delay(attempt - 1, text_str, last_error))
+            await self._rate_limiter.acquire_async()
+            try:
+                result = await self.translator.translate_async(text_str, dest='ko', src=self.src_lang)
+            except Exception as e:
+                if not _is_recoverable(e):
+                    raise  # 다시 보내도 같은 오류이므로 즉시 전파
+                self._rate_limiter.on_error()
+                last_error = e
+                continue
+            self._rate_limiter.on_success()
             return result.text
+        raise last_error  # 최대 재시도 횟수 초과 (호출하는 쪽에서 로깅)
+    
+    def _retry_delay(self, attempt: int, text_str: str, error: Exception) -> float:
+        """
+        재시도 전 대기 시간 계산 및 로깅 (동기/비동기 요청 공통, 지수 백오프 + 지터)
+        
+        Args:
+            attempt: 실패한 시도 번호 (0부터 시작)
+            text_str: 요청한 문자열 (로깅용)
+            error: 요청 중 발생한 예외
             
-        except ReadTimeout:
-            logger.error(f"헤더 번역 타임아웃: {text_str[:50] if 'text_str' in locals() else str(text)[:50]}...")
-            return text_str if 'text_str' in locals() else str(text)
-        except Exception as e:
-            logger.error(f"헤더 번역 오류: {text_str[:50] if 'text_str' in locals() else str(text)[:50]}... - {str(e)}")
-            return text_str if 'text_str' in locals() else str(text)
+        Returns:
+            재시도 전 대기 시간 (초)
+        """
+        wait_time = _backoff_delay(attempt)
+        logger.warning(
+            f"번역 일시적 오류 (시도 {attempt + 1}/{RETRY_MAX_ATTEMPTS}): "
+            f"'{text_str[:50]}...' - {wait_time:.1f}초 후 재시도 ({type(error).__name__})"
+        )
+        return wait_time
     
-    def translate_text(self, text: Union[str, float, int]) -> str:
+    def _chunk_texts(self, texts: list) -> list:
         """
-        텍스트를 한국어로 번역
+        문자열 목록을 요청 하나에 담을 수 있는 묶음으로 분할
         
         Args:
-            text: 번역할 텍스트
+            texts: 번역할 문자열 목록
             
         Returns:
-            번역된 텍스트 (한국어)
+            문자열 묶음 목록 (각 묶음은 BATCH_MAX_ITEMS개, BATCH_MAX_CHARS자 이하)
         """
-        self.total_cells += 1
+        chunks = []
+        chunk = []
+        chunk_chars = 0
         
-        try:
-            # 숫자나 None 값은 그대로 반환
-            if pd.isna(text) or text == '':
-                self.skipped_count += 1
-                if self.debug_mode:
-                    logger.debug(f"빈 셀 건너뜀: {text}")
-                # 진행률 업데이트 (성능 최적화: 10개마다 또는 0.5초마다)
-                if self.progress_callback and self.total_cells_to_process > 0:
-                    processed = self.translated_count + self.skipped_count
-                    if processed % 10 == 0 or (datetime.now() - self.last_progress_update).total_seconds() > 0.5:
-                        self.progress_callback(processed, self.total_cells_to_process)
-                        self.last_progress_update = datetime.now()
-                return text
+        for text_str in texts:
+            # 구분자가 포함된 텍스트는 분할 결과를 신뢰할 수 없으므로 단독 요청
+            if BATCH_DELIMITER in text_str or len(text_str) >= BATCH_MAX_CHARS:
+                chunks.append([text_str])
+                continue
             
-            # 숫자 타입은 문자열로 변환하지 않고 그대로 반환
-            if isinstance(text, (int, float)):
-                self.skipped_count += 1
-                if self.debug_mode:
-                    logger.debug(f"숫자 셀 건너뜀: {text}")
-                # 진행률 업데이트 (성능 최적화: 10개마다 또는 0.5초마다)
-                if self.progress_callback and self.total_cells_to_process > 0:
-                    processed = self.translated_count + self.skipped_count
-                    if processed % 10 == 0 or (datetime.now() - self.last_progress_update).total_seconds() > 0.5:
-                        self.progress_callback(processed, self.total_cells_to_process)
-                        self.last_progress_update = datetime.now()
-                return text
+            text_chars = len(text_str) + len(BATCH_SEPARATOR)
+            if chunk and (len(chunk) >= BATCH_MAX_ITEMS or chunk_chars + text_chars > BATCH_MAX_CHARS):
+                chunks.append(chunk)
+                chunk = []
+                chunk_chars = 0
             
-            text_str = str(text).strip()
-            
-            # 빈 문자열이면 그대로 반환
-            if not text_str:
-                self.skipped_count += 1
-                if self.debug_mode:
-                    logger.debug("빈 문자열 건너뜀")
-                # 진행률 업데이트 (성능 최적화: 10개마다 또는 0.5초마다)
-                if self.progress_callback and self.total_cells_to_process > 0:
-                    processed = self.translated_count + self.skipped_count
-                    if processed % 10 == 0 or (datetime.now() - self.last_progress_update).total_seconds() > 0.5:
-                        self.progress_callback(processed, self.total_cells_to_process)
-                        self.last_progress_update = datetime.now()
-                return text
+            chunk.append(text_str)
+            chunk_chars += text_chars
+        
+        if chunk:
+            chunks.append(chunk)
+        
+        return chunks
+    
+    def _translate_chunk(self, chunk: list) -> dict:
+        """
+        문자열 묶음을 구분자로 이어 붙여 한 번의 요청으로 번역
+        
+        번역 결과의 구분자 개수가 원문과 다르면 묶음 안의 문자열을 하나씩 다시 번역합니다.
+        여러 스레드에서 동시에 호출되므로 카운터는 수정하지 않습니다.
+        
+        Args:
+            chunk: 번역할 문자열 묶음
             
-            # 이미 한국어인지 간단 체크 (한글 포함 여부) - 최적화된 버전
-            # 처음 20자만 체크하여 성능 향상 (대부분의 경우 충분)
-            if any('\uAC00' <= char <= '\uD7A3' for char in text_str[:20]):
-                self.skipped_count += 1
-                if self.debug_mode:
-                    logger.debug(f"이미 한글 포함 텍스트 건너뜀: {text_str[:50]}")
-                # 진행률 업데이트 (성능 최적화: 10개마다 또는 0.5초마다)
-                if self.progress_callback and self.total_cells_to_process > 0:
-                    processed = self.translated_count + self.skipped_count
-                    if processed % 10 == 0 or (datetime.now() - self.last_progress_update).total_seconds() > 0.5:
-                        self.progress_callback(processed, self.total_cells_to_process)
-                        self.last_progress_update = datetime.now()
-                return text_str
+        Returns:
+            {원문: 번역문} 딕셔너리 (번역에 실패한 원문은 포함되지 않음)
+        """
+        if len(chunk) > 1:
+            try:
+                translated = self._request_translation(BATCH_SEPARATOR.join(chunk))
+            except Exception as e:
+                # 묶음 요청 실패 시 원문 유지
+                logger.error(f"묶음 번역 오류 ({len(chunk)}개 문자열, 첫 원문: {chunk[0][:50]}...): {str(e)}")
+                return {}
             
-            # 구글 번역 API 호출 (재시도 로직 포함)
-            if self.debug_mode:
-                logger.debug(f"번역 시작: {text_str[:100]}")
-            translate_start = datetime.now()
+            translations = self._split_chunk_result(chunk, translated)
+            if translations is not None:
+                return translations
+        
+        translations = {}
+        for text_str in chunk:
+            # 중지 플래그 확인
+            if self.should_stop:
+                raise InterruptedError("번역이 사용자에 의해 중지되었습니다.")
             
-            # 재시도 로직 (최대 3회, 지수 백오프)
-            max_retries = 3
-            retry_delays = [1, 2, 4]  # 1초, 2초, 4초
-            result = None
-            last_exception = None
+            try:
+                translations[text_str] = self._request_translation(text_str)
+            except Exception as e:
+                # 실패한 문자열은 원문 유지
+                logger.error(f"번역 오류 (원문: {text_str[:50]}...): {str(e)}")
+        
+        return translations
+    
+    async def _translate_chunk_async(self, chunk: list) -> dict:
+        """
+        _translate_chunk의 비동기 버전 (translate_async를 지원하는 클라이언트 전용)
+        
+        Args:
+            chunk: 번역할 문자열 묶음
             
-            for attempt in range(max_retries):
-                try:
-                    result = self.translator.translate(text_str, dest='ko')
-                    break  # 성공 시 루프 종료
-                except ReadTimeout as e:
-                    last_exception = e
-                    if attempt < max_retries - 1:
-                        wait_time = retry_delays[attempt]
-                        logger.warning(
-                            f"번역 타임아웃 (시도 {attempt + 1}/{max_retries}): "
-                            f"'{text_str[:50]}...' - {wait_time}초 후 재시도"
-                        )
-                        time.sleep(wait_time)
-                    else:
-                        logger.error(
-                            f"번역 타임아웃 (최대 재시도 횟수 초과): '{text_str[:50]}...'"
-                        )
-                except Exception as e:
-                    # 타임아웃이 아닌 다른 예외는 즉시 재시도하지 않음
-                    last_exception = e
-                    if isinstance(e, (ConnectionError, TimeoutError)) and attempt < max_retries - 1:
-                        wait_time = retry_delays[attempt]
-                        logger.warning(
-                            f"네트워크 오류 (시도 {attempt + 1}/{max_retries}): "
-                            f"'{text_str[:50]}...' - {wait_time}초 후 재시도"
-                        )
-                        time.sleep(wait_time)
-                    else:
-                        raise  # 다른 예외는 즉시 전파
+        Returns:
+            {원문: 번역문} 딕셔너리 (번역에 실패한 원문은 포함되지 않음)
+        """
+        if len(chunk) > 1:
+            try:
+                translated = await self._request_translation_async(BATCH_SEPARATOR.join(chunk))
+            except Exception as e:
+                # 묶음 요청 실패 시 원문 유지
+                logger.error(f"묶음 번역 오류 ({len(chunk)}개 문자열, 첫 원문: {chunk[0][:50]}...): {str(e)}")
+                return {}
             
-            # 재시도 후에도 실패한 경우 예외 발생
-            if result is None:
-                raise last_exception if last_exception else Exception("번역 실패")
+            translations = self._split_chunk_result(chunk, translated)
+            if translations is not None:
+                return translations
+        
+        translations = {}
+        for text_str in chunk:
+            # 중지 플래그 확인
+            if self.should_stop:
+                raise InterruptedError("번역이 사용자에 의해 중지되었습니다.")
             
-            translate_duration = (datetime.now() - translate_start).total_seconds()
-            self.translated_count += 1
+            try:
+                translations[text_str] = await self._request_translation_async(text_str)
+            except Exception as e:
+                # 실패한 문자열은 원문 유지
+                logger.error(f"번역 오류 (원문: {text_str[:50]}...): {str(e)}")
+        
+        return translations
+    
+    def _split_chunk_result(self, chunk: list, translated: str):
+        """
+        묶음 번역 결과를 구분자로 나누어 원문과 짝지음
+        
+        Args:
+            chunk: 원문 묶음
+            translated: 구분자로 이어진 번역 결과
             
-            # DEBUG 로그는 디버그 모드에서만 기록 (성능 향상)
-            if self.debug_mode:
-                logger.debug(
-                    f"번역 완료 ({translate_duration:.2f}초): "
-                    f"'{text_str[:50]}' -> '{result.text[:50]}'"
-                )
-            elif self.translated_count % 10 == 0:  # 10개마다 INFO 로그
-                logger.info(f"번역 진행 중... ({self.translated_count}개 완료)")
-            
-            # 진행률 콜백 호출 (성능 최적화: 10개마다 또는 0.5초마다)
-            if self.progress_callback and self.total_cells_to_process > 0:
-                processed = self.translated_count + self.skipped_count
-                if processed % 10 == 0 or (datetime.now() - self.last_progress_update).total_seconds() > 0.5:
-                    self.progress_callback(processed, self.total_cells_to_process, 
-                                         f"번역 중... ({self.translated_count}개 번역 완료)")
-                    self.last_progress_update = datetime.now()
-            
-            # API 제한을 고려한 딜레이 (최소화)
-            # googletrans는 무료 API이지만 과도한 딜레이는 불필요
-            time.sleep(0.01)  # 0.1초 → 0.01초로 최적화 (10배 향상)
+        Returns:
+            {원문: 번역문} 딕셔너리 (개수가 맞지 않으면 None)
+        """
+        parts = [part.strip() for part in translated.split(BATCH_DELIMITER)]
+        if len(parts) == len(chunk):
+            return dict(zip(chunk, parts))
+        
+        logger.warning(
+            f"묶음 번역 결과 분할 불일치 (원문 {len(chunk)}개, 결과 {len(parts)}개) - 개별 번역으로 재시도"
+        )
+        return None
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """
+        번역 요청용 스레드 풀 반환 (컬럼/시트 간 재사용)
+        
+        asyncio.run()의 기본 실행기는 호출마다 새로 만들어지므로
+        전용 스레드 풀을 한 번만 생성하여 계속 사용합니다.
+        
+        Returns:
+            번역 요청용 ThreadPoolExecutor
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=MAX_CONCURRENT_REQUESTS,
+                thread_name_prefix="translate"
+            )
+        return self._executor
+    
+    def _shutdown_executor(self):
+        """번역 요청용 스레드 풀 종료"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+    
+    async def _translate_chunks_async(self, chunks: list, cell_counts: dict = None) -> dict:
+        """
+        여러 묶음을 동시에 번역
+        
+        클라이언트가 translate_async를 지원하면(gtx 클라이언트) 이벤트 루프 하나에서
+        최대 MAX_CONCURRENT_ASYNC_REQUESTS개 요청을 동시에 진행합니다.
+        googletrans는 동기 API이므로 각 요청은 번역 스레드 풀에서 수행하고,
+        이벤트 루프는 세마포어로 동시 요청 수(MAX_CONCURRENT_REQUESTS)만 제한합니다.
+        
+        Args:
+            chunks: 문자열 묶음 목록
+            cell_counts: {원문: 셀 수} (묶음이 끝날 때마다 진행률에 반영, None이면 반영하지 않음)
             
-            return result.text
+        Returns:
+            {원문: 번역문} 딕셔너리 (번역에 실패한 원문은 포함되지 않음)
+        """
+        native_async = hasattr(self.translator, 'translate_async')
+        if native_async:
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_ASYNC_REQUESTS)
+        else:
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+            loop = asyncio.get_running_loop()
+            executor = self._get_executor()
+        completed = 0
+        
+        async def translate_one(chunk):
+            nonlocal completed
+            async with semaphore:
+                # 중지 플래그 확인
+                if self.should_stop:
+                    raise InterruptedError("번역이 사용자에 의해 중지되었습니다.")
+                if native_async:
+                    chunk_translations = await self._translate_chunk_async(chunk)
+                else:
+                    chunk_translations = await loop.run_in_executor(executor, self._translate_chunk, chunk)
             
-        except ReadTimeout as e:
-            # 타임아웃 예외 특별 처리
-            self.error_count += 1
-            error_msg = f"번역 타임아웃 (재시도 실패): {text_str[:50] if 'text_str' in locals() else str(text)[:50]}..."
-            logger.error(error_msg, exc_info=True)
+            # 묶음마다 영구 캐시에 저장 (중간에 중지해도 다음 실행에서 재사용)
+            if self._disk_cache is not None:
+                self._disk_cache.put_many(self._cacheable(chunk_translations))
             
-            if self.debug_mode:
-                print(error_msg)
+            # 진행 상황 표시 (묶음 단위, 0.5초마다)
+            completed += 1
+            if cell_counts is not None:
+                self._prefetched_cells += sum(cell_counts.get(text_str, 0) for text_str in chunk)
+            self._tick_progress(f"번역 중... (요청 {completed}/{len(chunks)} 완료)")
+            return chunk_translations
+        
+        translations = {}
+        try:
+            for chunk_translations in await asyncio.gather(*(translate_one(chunk) for chunk in chunks)):
+                translations.update(chunk_translations)
+        finally:
+            # 비동기 클라이언트의 연결은 이 이벤트 루프에 묶여 있으므로 루프가 끝나기 전에 정리
+            if native_async:
+                await self.translator.aclose()
+        
+        return translations
+    
+    def _tick_progress(self, detail: str, force: bool = False):
+        """
+        진행률 콜백 호출 (PROGRESS_INTERVAL초에 한 번으로 제한)
+        
+        Args:
+            detail: 상세 정보 텍스트
+            force: True면 마지막 호출 후 지난 시간과 관계없이 호출 (시트 완료 등)
+        """
+        if not self.progress_callback or self.total_cells_to_process <= 0:
+            return
+        
+        now = time.monotonic()
+        if not force and now - self._last_tick < PROGRESS_INTERVAL:
+            return
+        self._last_tick = now
+        # 네트워크 요청은 대부분 사전 번역 단계에서 끝나므로 그 단계의 진행분도 반영 (진행률이 뒤로 가지 않도록 큰 값 사용)
+        current = max(self._prefetched_cells, self.translated_count + self.skipped_count)
+        self.progress_callback(current, self.total_cells_to_process, detail)
+    
+    def _translate_batch(self, texts: list, cell_counts: dict = None) -> dict:
+        """
+        고유 문자열 목록을 묶음 단위로 동시에 번역
+        
+        캐시에 없는 문자열만 구분자로 이어 붙여 요청 수를 줄이고,
+        묶음 요청은 asyncio로 동시에 보냅니다.
+        
+        Args:
+            texts: 번역할 문자열 목록 (중복 없음, 공백 제거됨)
+            cell_counts: {원문: 셀 수} (사전 번역 단계 진행률용, None이면 진행률에 반영하지 않음)
             
-            # 타임아웃 발생 시 원문 반환 (재시도 후에도 실패한 경우)
-            return text_str if 'text_str' in locals() else str(text)
+        Returns:
+            {원문: 번역문} 딕셔너리 (번역에 실패한 원문은 포함되지 않음)
+        """
+        # 캐시에 있는 문자열은 요청하지 않음
+        translations = {}
+        pending = []
+        for text_str in texts:
+            cached = self._trans_cache.get(text_str)
+            if cached is not None:
+                translations[text_str] = cached
+            else:
+                pending.append(text_str)
+        
+        # 메모리 캐시에 없는 문자열은 영구 캐시에서 한 번에 조회
+        if pending and self._disk_cache is not None:
+            stored = self._disk_cache.get_many(pending)
+            if stored:
+                self._trans_cache.update(stored)
+                translations.update(stored)
+                pending = [text_str for text_str in pending if text_str not in stored]
+        
+        # 문자열마다 한 번만 집계됨: 워크북 사전 번역에서 조회하고, 시트별 단계는 그 결과를 직접 받아
+        # 사전 번역에서 실패한 문자열만 다시 이 메서드로 넘기므로 같은 문자열이 적중으로 두 번 세어지지 않음
+        self._cache_hits += len(translations)
+        self._cache_misses += len(pending)
+        if cell_counts is not None:
+            self._prefetched_cells += sum(cell_counts.get(text_str, 0) for text_str in translations)
+        
+        if pending:
+            new_translations = asyncio.run(self._translate_chunks_async(self._chunk_texts(pending), cell_counts))
+            self.error_count += len(pending) - len(new_translations)
             
-        except Exception as e:
-            # 기타 예외 처리
-            self.error_count += 1
-            error_msg = f"번역 오류 (원문: {text_str[:50] if 'text_str' in locals() else str(text)[:50]}...): {str(e)}"
-            logger.error(error_msg, exc_info=True)
-            logger.debug(f"스택 트레이스:\n{traceback.format_exc()}")
+            # 원본 언어를 고정했는데 원문 그대로 돌아온 문자열은 다른 언어일 수 있으므로 언어를 확인
+            if self.src_lang != 'auto':
+                unchanged = [text_str for text_str, translated in new_translations.items()
+                             if translated.strip() == text_str]
+                if unchanged:
+                    new_translations.update(self._retry_unchanged(unchanged, new_translations))
             
-            if self.debug_mode:
-                print(error_msg)
+            self._trans_cache.update(self._cacheable(new_translations))  # 영구 캐시에는 묶음마다 이미 저장됨
+            translations.update(new_translations)
+        
+        return translations
+    
+    def _retry_unchanged(self, unchanged: list, translations: dict) -> dict:
+        """
+        원본 언어를 고정한 요청에서 원문 그대로 돌아온 문자열 처리
+        
+        문자열마다 언어를 감지하여 고정한 원본 언어나 대상 언어(ko)가 아닌 문자열만
+        자동 감지(src='auto')로 다시 요청합니다. 이름, 코드처럼 원래 번역되지 않는 문자열은
+        다시 요청하지 않고 원문 그대로를 결과로 확정합니다.
+        확정한 결과는 메모리 캐시와 영구 캐시에 함께 저장하여 다음 실행에서 다시 감지하지 않으며,
+        언어 감지나 재요청에 실패한 문자열은 어느 캐시에도 저장하지 않습니다.
+        
+        Args:
+            unchanged: 원문 그대로 돌아온 문자열 목록
+            translations: 고정한 원본 언어로 받은 {원문: 번역문} 딕셔너리
             
-            return text_str if 'text_str' in locals() else str(text)  # 오류 발생 시 원문 반환
+        Returns:
+            {원문: 번역문} 딕셔너리 (다시 요청한 문자열은 자동 감지 결과)
+        """
+        pinned_lang = self.src_lang
+        detected = dict(zip(unchanged, self._get_executor().map(self._detect_text_language, unchanged)))
+        foreign = [text_str for text_str in unchanged if detected[text_str] not in (None, pinned_lang, 'ko')]
+        resolved = {text_str: translations[text_str] for text_str in unchanged
+                    if detected[text_str] in (pinned_lang, 'ko')}
+        
+        if foreign:
+            logger.info(f"원문 그대로 돌아온 문자열 중 다른 언어로 감지된 {len(foreign)}개를 원본 언어 자동 감지로 다시 요청")
+            self.src_lang = 'auto'
+            try:
+                resolved.update(asyncio.run(self._translate_chunks_async(self._chunk_texts(foreign))))
+            finally:
+                self.src_lang = pinned_lang
+        
+        self._store_cached(resolved)
+        return resolved
     
-    def translate_dataframe(self, df: pd.DataFrame, sheet_name: str = "", source_ws=None) -> pd.DataFrame:
+    def _detect_text_language(self, text_str: str):
         """
-        DataFrame의 모든 셀을 번역
+        문자열 하나의 언어 감지 (번역 스레드 풀에서 호출)
         
         Args:
-            df: 번역할 DataFrame
-            sheet_name: 시트 이름 (로깅용)
-            source_ws: 원본 워크시트 (openpyxl, 날짜 형식 확인용)
+            text_str: 언어를 감지할 문자열
             
         Returns:
-            번역된 DataFrame
+            감지된 언어 코드 (감지에 실패하면 None)
         """
-        logger.info(f"DataFrame 번역 시작 (시트: {sheet_name}, 행: {len(df)}, 열: {len(df.columns)})")
-        translated_df = df.copy()
+        # 중지 플래그 확인
+        if self.should_stop:
+            raise InterruptedError("번역이 사용자에 의해 중지되었습니다.")
         
-        start_time = datetime.now()
-        total_cells_before = self.total_cells
+        self._rate_limiter.acquire()
+        try:
+            lang = self.translator.detect(text_str).lang
+        except Exception as e:
+            if _is_recoverable(e):
+                self._rate_limiter.on_error()
+            logger.warning(f"언어 감지 실패 (원문: {text_str[:50]}...): {str(e)}")
+            return None
+        self._rate_limiter.on_success()
+        return lang if isinstance(lang, str) and lang != 'auto' else None
+    
+    def cache_info(self) -> dict:
+        """
+        번역 캐시 통계 반환
         
-        print("번역 중...")
-        logger.debug(f"컬럼 목록: {list(df.columns)}")
+        Returns:
+            {'hits': 캐시 적중 횟수, 'misses': API로 요청한 문자열 수, 'size': 캐시 항목 수}
+        """
+        return {
+            'hits': self._cache_hits,
+            'misses': self._cache_misses,
+            'size': len(self._trans_cache),
+        }
+    
+    def translate_text(self, text: str) -> str:
+        """
+        문자열 하나를 한국어로 번역
         
-        # 컬럼명(헤더) 번역
-        translated_columns = {}
-        logger.info("컬럼명(헤더) 번역 시작")
-        for col_idx, col in enumerate(df.columns):
+        빈 셀, 숫자, 한글 포함 셀 등은 호출하는 쪽의 벡터 마스크(_select_translatable)에서
+        미리 걸러내므로 이 메서드는 번역 대상 문자열만 받습니다.
+        
+        Args:
+            text: 번역할 문자열 (공백 제거됨)
+            
+        Returns:
+            번역된 텍스트 (한국어, 실패 시 원문)
+        """
+        cached = self._get_cached(text)
+        if cached is not None:
+            self._cache_hits += 1
+            self.translated_count += 1
+            return cached
+        self._cache_misses += 1
+        
+        try:
+            translated_text = self._request_translation(text)
+        except Exception as e:
+            self.error_count += 1
+            logger.error(f"번역 오류 (원문: {text[:50]}...): {str(e)}")
+            return text  # 오류 발생 시 원문 반환
+        
+        self._store_cached(self._cacheable({text: translated_text}))
+        self.translated_count += 1
+        return translated_text
+    
+    def _header_texts(self, columns: list, source_ws=None) -> list:
+        """
+        컬럼 위치별 헤더 문자열 만들기 (날짜 시리얼 번호 헤더는 날짜 문자열로 변환)
+        
+        Args:
+            columns: DataFrame 컬럼명 목록
+            source_ws: 원본 워크시트 (openpyxl, 날짜 형식 확인용)
+            
+        Returns:
+            컬럼 위치별 헤더 문자열 목록 (빈 헤더는 빈 문자열)
+        """
+        header_texts = []  # 컬럼 위치별 헤더 문자열
+        for col_idx, col in enumerate(columns):
             if self.should_stop:
                 raise InterruptedError("번역이 사용자에 의해 중지되었습니다.")
             
@@ -391,8 +1128,9 @@ class ExcelTranslator:
                     source_cell = source_ws.cell(row=1, column=col_idx + 1)
                     source_value = source_cell.value
                     
-                    # 디버그: 셀 정보 출력
-                    logger.info(f"컬럼 {col_idx + 1}: value={source_value}, type={type(source_value)}, number_format='{source_cell.number_format}'")
+                    # 디버그: 셀 정보 출력 (디버그 모드에서만)
+                    if self.debug_mode:
+                        logger.debug(f"컬럼 {col_idx + 1}: value={source_value}, type={type(source_value)}, number_format='{source_cell.number_format}'")
                     
                     # 날짜 시리얼 번호인지 확인
                     if isinstance(source_value, (int, float)):
@@ -404,7 +1142,8 @@ class ExcelTranslator:
                         # 너무 작은 숫자(예: 717)는 제외하여 일반 숫자와 구분
                         is_date_range = 42000 <= source_value <= 73050
                         
-                        logger.info(f"날짜 형식 확인: '{source_cell.number_format}' -> 형식={is_date_format}, 범위={is_date_range}")
+                        if self.debug_mode:
+                            logger.debug(f"날짜 형식 확인: '{source_cell.number_format}' -> 형식={is_date_format}, 범위={is_date_range}")
                         
                         # 날짜 형식이거나 날짜 범위에 있으면 날짜로 변환
                         if is_date_format or is_date_range:
@@ -415,90 +1154,188 @@ class ExcelTranslator:
                     logger.warning(f"원본 워크시트에서 컬럼 값 읽기 실패: {str(e)}")
             
             # 원본에서 읽지 못했으면 DataFrame의 컬럼명 사용
+            # (빈 헤더 셀은 컬럼명으로 옮길 때 None이 NaN으로 바뀌므로 함께 빈 문자열로 처리)
             if col_str is None:
-                col_str = str(col).strip() if col is not None else ""
+                col_str = "" if col is None or (isinstance(col, float) and pd.isna(col)) else str(col).strip()
             
-            # 헤더는 항상 번역 시도 (숫자 체크 건너뛰기)
-            if col_str:
-                translated_col = self._translate_header_cell(col_str)
-            else:
-                translated_col = col_str
-            translated_columns[col] = translated_col
-            logger.debug(f"컬럼명 번역: '{col}' -> '{translated_col}'")
+            header_texts.append(col_str)
+        
+        return header_texts
+    
+    def translate_dataframe(self, df: pd.DataFrame, sheet_name: str = "", source_ws=None,
+                            column_targets: list = None, header_texts: list = None,
+                            prefetched: dict = None) -> pd.DataFrame:
+        """
+        DataFrame의 모든 셀을 번역
+        
+        복사본을 만들지 않고 전달받은 DataFrame을 직접 수정합니다.
+        
+        Args:
+            df: 번역할 DataFrame (번역 결과로 덮어씀)
+            sheet_name: 시트 이름 (로깅용)
+            source_ws: 원본 워크시트 (openpyxl, 날짜 형식 확인용)
+            column_targets: _select_column_targets 결과 (None이면 여기서 선택)
+            header_texts: _header_texts 결과 (None이면 여기서 생성)
+            prefetched: 워크북 사전 번역 결과 {원문: 번역문} (여기에 없는 문자열만 다시 요청)
+            
+        Returns:
+            번역된 DataFrame (전달받은 df와 같은 객체)
+        """
+        logger.info(f"DataFrame 번역 시작 (시트: {sheet_name}, 행: {len(df)}, 열: {len(df.columns)})")
+        original_columns = list(df.columns)
+        
+        start_time = datetime.now()
+        total_cells_before = self.total_cells
+        
+        print("번역 중...")
+        # 디버그 로그의 f-string(컬럼 목록 등)은 DEBUG 레벨일 때만 만들도록 미리 확인
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            logger.debug(f"컬럼 목록: {list(df.columns)}")
+        
+        # 컬럼명(헤더) 번역
+        # 워크북 사전 번역 단계에서 이미 만들었으면 그 결과를 재사용
+        logger.info("컬럼명(헤더) 번역 시작")
+        if header_texts is None:
+            header_texts = self._header_texts(original_columns, source_ws)
+        
+        # 헤더는 항상 번역 시도 (숫자 체크 건너뛰기) - 고유 헤더를 동시에 번역
+        header_translations = self._translate_headers([text for text in header_texts if text], prefetched)
+        if self.debug_mode:
+            for col, col_str in zip(original_columns, header_texts):
+                logger.debug(f"컬럼명 번역: '{col}' -> '{header_translations.get(col_str, col_str)}'")
         
         # 번역된 컬럼명으로 DataFrame 컬럼명 변경
         # 모든 컬럼명을 문자열로 명시적 변환
-        translated_df.columns = [str(translated_columns.get(col, col)) for col in df.columns]
+        df.columns = [str(header_translations.get(col_str, col_str)) for col_str in header_texts]
         logger.info("컬럼명(헤더) 번역 완료")
-        logger.debug(f"변경된 컬럼명: {list(translated_df.columns)}")
+        if debug_enabled:
+            logger.debug(f"변경된 컬럼명: {list(df.columns)}")
         
-        for col_idx, col in enumerate(df.columns, 1):
-            # 중지 플래그 확인
-            if self.should_stop:
-                logger.warning(f"번역 중지 요청됨 (시트: {sheet_name}, 컬럼: {col})")
-                raise InterruptedError("번역이 사용자에 의해 중지되었습니다.")
-            
-            col_start_time = datetime.now()
-            col_translated_before = self.translated_count
-            logger.info(f"컬럼 '{col}' 번역 시작 ({col_idx}/{len(df.columns)})")
-            print(f"  컬럼 '{col}' 번역 중... ({col_idx}/{len(df.columns)})")
+        # 1단계: 컬럼별 번역 대상 셀 선택 (빈 셀, 숫자, 한글 포함 셀 제외 - 벡터 연산)
+        # 워크북 사전 번역 단계에서 이미 선택했으면 그 결과를 재사용 (셀 위치 기준이라 헤더 변경과 무관)
+        if column_targets is None:
+            column_targets = self._select_column_targets(df, sheet_name)
+        self.total_cells += len(df) * len(original_columns)
+        self.skipped_count += len(df) * len(original_columns) - sum(len(texts) for _, _, texts, _ in column_targets)
+        for col_idx, _, _, hangul_count in column_targets:
+            if hangul_count:
+                logger.info(f"컬럼 '{original_columns[col_idx]}': 이미 한국어인 셀 {hangul_count}개 건너뜀")
+        
+        # 2단계: 시트 전체의 고유 문자열을 한 번에 번역 (여러 컬럼의 요청이 동시에 진행됨)
+        unique_texts = list(dict.fromkeys(
+            text_str for _, _, texts, _ in column_targets for text_str in texts
+        ))
+        logger.info(f"시트 '{sheet_name}' 번역 대상: 고유 문자열 {len(unique_texts)}개")
+        print(f"  고유 문자열 {len(unique_texts)}개 번역 중...")
+        
+        # 사전 번역 결과를 그대로 사용하고, 사전 번역 단계에 없던 문자열만 요청
+        # (메모리 캐시는 크기 제한이 있어 사전 번역한 문자열이 이미 밀려났을 수 있음)
+        # 사전 번역에서 실패한 문자열은 그 단계에서 이미 오류로 집계했으므로 다시 요청하지 않고 원문 유지
+        if prefetched is None:
+            prefetched = {}
+        pending = [text_str for text_str in unique_texts
+                   if text_str not in prefetched and text_str not in self._prefetch_failed]
+        try:
+            if pending:
+                translations = {**prefetched, **self._translate_batch(pending)}
+            else:
+                translations = prefetched
+        except InterruptedError:
+            # 중지 요청은 예외로 전파하여 상위에서 처리
+            raise
+        except Exception as e:
+            # 스택 트레이스는 translate_excel의 최상위 처리에서 한 번만 기록
+            logger.error(f"시트 '{sheet_name}' 번역 중 오류 발생: {str(e)}")
+            raise
+        
+        # 3단계: 번역 결과를 컬럼별로 셀에 다시 매핑
+        # (셀마다 반복되는 속성 조회를 피하기 위해 지역 변수로 바인딩)
+        get_translation = translations.get
+        cell_setter = df.iloc
+        for col_idx, positions, texts, _ in column_targets:
+            if not texts:
+                continue
             
-            try:
-                # 진행 상황 표시를 위한 콜백 함수
-                def translate_with_progress(cell_value):
-                    # 중지 플래그 확인
-                    if self.should_stop:
-                        raise InterruptedError("번역이 사용자에 의해 중지되었습니다.")
-                    result = self.translate_text(cell_value)
-                    # 10개마다 진행 상황 출력
-                    if self.translated_count > 0 and self.translated_count % 10 == 0:
-                        print(f"    진행 중... ({self.translated_count}개 번역 완료)", end='\r')
-                    return result
-                
-                # 번역된 컬럼명 사용
-                translated_col_name = translated_columns[col]
-                translated_df[translated_col_name] = df[col].apply(translate_with_progress)
-                col_duration = (datetime.now() - col_start_time).total_seconds()
-                col_translated = self.translated_count - col_translated_before
-                
-                logger.info(
-                    f"컬럼 '{col}' 번역 완료 ({col_duration:.2f}초, "
-                    f"번역된 셀: {col_translated}/{len(df)}, 누적 번역: {self.translated_count})"
-                )
-                print(f"  ✓ 컬럼 '{col}' 완료 ({col_translated}개 번역, {col_duration:.2f}초)")
-            except InterruptedError:
-                # 중지 요청은 예외로 전파하여 상위에서 처리
-                raise
-            except Exception as e:
-                logger.error(f"컬럼 '{col}' 번역 중 오류 발생: {str(e)}", exc_info=True)
-                logger.debug(f"스택 트레이스:\n{traceback.format_exc()}")
-                raise
+            translated_values = [get_translation(text_str, text_str) for text_str in texts]
+            cell_setter[positions, col_idx] = translated_values
+            col_translated = sum(1 for text_str in texts if text_str in translations)
+            self.translated_count += col_translated
+            logger.info(
+                f"컬럼 '{original_columns[col_idx]}' 번역 완료 ({col_idx + 1}/{len(df.columns)}, "
+                f"번역된 셀: {col_translated}/{len(df)}, 누적 번역: {self.translated_count})"
+            )
+        
+        # 진행률 업데이트 (시트 단위, 간격과 관계없이 표시)
+        self._tick_progress(f"번역 중... ({self.translated_count}개 번역 완료)", force=True)
         
         duration = (datetime.now() - start_time).total_seconds()
         logger.info(f"DataFrame 번역 완료 (소요 시간: {duration:.2f}초)")
         
-        return translated_df
+        return df
     
-    def _copy_sheet_with_formatting(self, source_ws, output_ws, translated_df, sheet_name):
+    def _estimate_sheet_cells(self, size_wb, sheet_names: list) -> dict:
+        """
+        시트별 데이터 셀 수 추정 (진행률 계산용)
+        
+        읽기 전용 워크북의 시트 크기 정보만 사용하므로 셀 내용을 파싱하지 않습니다.
+        
+        Args:
+            size_wb: 읽기 전용 모드로 연 원본 워크북 (openpyxl)
+            sheet_names: 시트 이름 목록
+            
+        Returns:
+            {시트 이름: 헤더를 제외한 셀 수} 딕셔너리
+        """
+        estimates = {}
+        for sheet_name in sheet_names:
+            ws = size_wb[sheet_name]
+            # 크기 정보가 없는 파일은 전체 행을 확인하여 계산
+            if ws.max_row is None or ws.max_column is None:
+                ws.reset_dimensions()
+                ws.calculate_dimension(force=True)
+            max_row = ws.max_row or 0
+            max_col = ws.max_column or 0
+            estimates[sheet_name] = max(max_row - 1, 0) * max_col
+        
+        return estimates
+    
+    def _copy_sheet_with_formatting(self, source_ws, output_ws, translated_df, sheet_name, style_cache: dict = None):
         """
         원본 시트의 서식을 복사하면서 번역된 데이터를 저장
         
         Args:
             source_ws: 원본 워크시트 (openpyxl)
-            output_ws: 출력 워크시트 (openpyxl)
+            output_ws: 출력 워크시트 (openpyxl 쓰기 전용, 행 단위로 추가)
             translated_df: 번역된 DataFrame
             sheet_name: 시트 이름
+            style_cache: {원본 스타일 인덱스: 출력 스타일 인덱스} (같은 워크북의 시트끼리 공유, None이면 시트 안에서만 사용)
         """
+        if style_cache is None:
+            style_cache = {}
+        # 셀 반복문 안의 디버그 로그는 DEBUG 레벨일 때만 문자열을 만들도록 한 번 확인
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         logger.debug(f"서식 복사 시작 (시트: {sheet_name})")
+        style_error_count = 0  # 서식 복사에 실패한 스타일 조합 수
+        first_style_error = None  # 요약 로그에 남길 첫 오류 (셀 좌표: 메시지)
         
         # 원본 파일의 모든 행과 열 복사 (서식 완벽 유지)
         max_row = source_ws.max_row  # 원본 파일의 모든 행
         # DataFrame의 실제 컬럼 수와 openpyxl의 max_column 중 더 큰 값 사용
         # 두 번째 시트 등에서 max_column이 실제 데이터 범위보다 작을 수 있음
         max_col = max(len(translated_df.columns), source_ws.max_column) if len(translated_df.columns) > 0 else source_ws.max_column
-        logger.debug(f"시트 '{sheet_name}' - DataFrame 컬럼 수: {len(translated_df.columns)}, source_ws.max_column: {source_ws.max_column}, 사용할 max_col: {max_col}")
+        if debug_enabled:
+            logger.debug(f"시트 '{sheet_name}' - DataFrame 컬럼 수: {len(translated_df.columns)}, source_ws.max_column: {source_ws.max_column}, 사용할 max_col: {max_col}")
+        
+        # 셀 값은 NumPy 배열에서 바로 읽음 (셀마다 .iloc을 거치면 pandas 인덱서 비용이 셀 수만큼 듦)
+        # 2차원 배열로 합치면 시트 전체가 복사되므로 컬럼별 배열로 받음 (문자열 컬럼은 복사 없이 공유)
+        column_values = [translated_df.iloc[:, col_idx].to_numpy(dtype=object)
+                         for col_idx in range(len(translated_df.columns))]
+        header_values = list(translated_df.columns)
+        n_rows_df = len(translated_df)
+        n_cols_df = len(header_values)
         
-        # 모든 컬럼 너비 복사
+        # 모든 컬럼 너비 복사 (쓰기 전용 시트는 첫 행을 추가하기 전에 설정해야 함)
         for col_idx in range(1, max_col + 1):
             col_letter = get_column_letter(col_idx)
             if col_letter in source_ws.column_dimensions:
@@ -507,86 +1344,338 @@ class ExcelTranslator:
                     output_ws.column_dimensions[col_letter].width = source_width
         
         # 모든 행과 셀의 서식 복사
-        for row_idx in range(1, max_row + 1):
+        # (셀마다 좌표 문자열을 만들어 조회하지 않고 원본 시트의 행을 순서대로 순회)
+        source_rows = source_ws.iter_rows(min_row=1, max_row=max_row, max_col=max_col)
+        for row_idx, source_row in enumerate(source_rows, 1):
             # 중지 플래그 확인
             if self.should_stop:
                 raise InterruptedError("번역이 사용자에 의해 중지되었습니다.")
             
-            # 행 높이 복사
+            # 행 높이 복사 (행을 추가하기 전에 설정)
             if row_idx in source_ws.row_dimensions:
                 source_height = source_ws.row_dimensions[row_idx].height
                 if source_height:
                     output_ws.row_dimensions[row_idx].height = source_height
             
-            for col_idx in range(1, max_col + 1):
-                col_letter = get_column_letter(col_idx)
-                source_cell = source_ws[f"{col_letter}{row_idx}"]
-                output_cell = output_ws[f"{col_letter}{row_idx}"]
+            row_cells = []
+            for col_idx, source_cell in enumerate(source_row, 1):
+                output_cell = WriteOnlyCell(output_ws)
+                row_cells.append(output_cell)
                 
                 # 셀 서식 복사 (스타일, 폰트, 테두리, 채우기 등) - 모든 셀에 대해
-                try:
-                    if source_cell.has_style:
-                        if source_cell.font:
-                            output_cell.font = copy(source_cell.font)
-                        if source_cell.border:
-                            output_cell.border = copy(source_cell.border)
-                        if source_cell.fill:
-                            output_cell.fill = copy(source_cell.fill)
-                        if source_cell.number_format:
-                            output_cell.number_format = source_cell.number_format
-                        if source_cell.protection:
-                            output_cell.protection = copy(source_cell.protection)
-                        if source_cell.alignment:
-                            output_cell.alignment = copy(source_cell.alignment)
-                except Exception as e:
-                    logger.debug(f"셀 서식 복사 중 오류 (무시): {str(e)}")
+                # _style은 워크북별 스타일 테이블의 인덱스이므로 원본 값을 그대로 옮길 수 없음
+                # 같은 서식 조합은 처음 한 번만 속성별로 복사하고, 이후에는 출력 워크북의 인덱스를 재사용
+                if source_cell.has_style:
+                    style_key = tuple(source_cell._style)
+                    output_style = style_cache.get(style_key)
+                    if output_style is not None:
+                        output_cell._style = copy(output_style)
+                    else:
+                        try:
+                            if source_cell.font:
+                                output_cell.font = copy(source_cell.font)
+                            if source_cell.border:
+                                output_cell.border = copy(source_cell.border)
+                            if source_cell.fill:
+                                output_cell.fill = copy(source_cell.fill)
+                            if source_cell.number_format:
+                                output_cell.number_format = source_cell.number_format
+                            if source_cell.protection:
+                                output_cell.protection = copy(source_cell.protection)
+                            if source_cell.alignment:
+                                output_cell.alignment = copy(source_cell.alignment)
+                            style_cache[style_key] = copy(output_cell._style)
+                        except Exception as e:
+                            # 셀마다 로그를 남기지 않고 시트 끝에서 한 번에 요약
+                            style_error_count += 1
+                            if first_style_error is None:
+                                first_style_error = f"{source_cell.coordinate}: {str(e)}"
                 
                 # 번역된 데이터 쓰기 (데이터가 있는 부분만)
                 if row_idx == 1:
                     # 헤더 행 - 이미 translate_dataframe에서 번역된 컬럼명 사용
-                    if col_idx <= len(translated_df.columns):
+                    if col_idx <= n_cols_df:
                         # DataFrame에서 번역된 컬럼명 직접 가져오기
-                        translated_header_value = translated_df.columns[col_idx - 1]
+                        translated_header_value = header_values[col_idx - 1]
                         
                         # datetime 객체나 다른 타입일 수 있으므로 문자열로 명시적 변환
                         if not isinstance(translated_header_value, str):
                             translated_header_value = str(translated_header_value)
-                            logger.debug(f"헤더 값을 문자열로 변환: {type(translated_df.columns[col_idx - 1])} -> str")
+                            if debug_enabled:
+                                logger.debug(f"헤더 값을 문자열로 변환: {type(header_values[col_idx - 1])} -> str")
                         
                         # 원본이 날짜 형식이었다면 텍스트 형식을 먼저 설정
                         # (값을 쓰기 전에 형식을 설정해야 올바르게 표시됨)
                         if source_cell.number_format and self._is_date_format(source_cell.number_format):
                             output_cell.number_format = '@'  # 텍스트 형식
-                            logger.debug(f"헤더 셀 날짜 형식 -> 텍스트 형식으로 변경: '{source_cell.number_format}' -> '@'")
+                            if debug_enabled:
+                                logger.debug(f"헤더 셀 날짜 형식 -> 텍스트 형식으로 변경: '{source_cell.number_format}' -> '@'")
                         
                         # 형식 설정 후 값 쓰기
                         output_cell.value = translated_header_value
-                        logger.debug(f"헤더 셀 쓰기: 컬럼 {col_idx} -> '{translated_header_value}'")
+                        if debug_enabled:
+                            logger.debug(f"헤더 셀 쓰기: 컬럼 {col_idx} -> '{translated_header_value}'")
                     else:
                         # DataFrame 범위를 벗어난 열은 원본 값 유지
                         output_cell.value = source_cell.value
                 else:
                     # 데이터 행
                     df_row_idx = row_idx - 2  # 헤더(1) 제외하고 0부터 시작
-                    if 0 <= df_row_idx < len(translated_df) and col_idx <= len(translated_df.columns):
+                    if 0 <= df_row_idx < n_rows_df and col_idx <= n_cols_df:
                         # 번역된 데이터가 있는 경우
-                        col_name = translated_df.columns[col_idx - 1]
-                        value = translated_df.iloc[df_row_idx, col_idx - 1]
-                        output_cell.value = value
+                        cell_value = column_values[col_idx - 1][df_row_idx]
+                        if source_cell.data_type == 'f' and pd.isna(cell_value):
+                            # 저장된 계산 값이 없는 수식 셀은 빈 값 대신 원본 수식 유지
+                            cell_value = source_cell.value
+                        output_cell.value = cell_value
                     else:
                         # 번역 범위를 벗어난 셀은 원본 값 유지
                         output_cell.value = source_cell.value
+            
+            # 완성된 행은 바로 임시 파일로 기록되고 메모리에서 해제됨
+            output_ws.append(row_cells)
         
-        # 병합된 셀 복사 (원본 파일의 모든 병합 셀)
+        # 병합된 셀 복사 (원본 파일의 모든 병합 셀, 쓰기 전용 시트는 저장 시 기록)
         if hasattr(source_ws, 'merged_cells') and source_ws.merged_cells:
             for merged_range in list(source_ws.merged_cells.ranges):
                 try:
-                    output_ws.merge_cells(str(merged_range))
+                    output_ws.merged_cells.add(str(merged_range))
                 except Exception as e:
                     logger.debug(f"병합 셀 복사 실패 (무시): {str(e)}")
         
+        if style_error_count:
+            logger.warning(f"시트 '{sheet_name}' 셀 서식 복사 오류 {style_error_count}건 (무시, 첫 오류 {first_style_error})")
         logger.debug(f"서식 복사 완료 (시트: {sheet_name})")
     
+    def _write_sheets(self, output_wb, write_queue: queue.Queue):
+        """
+        저장 스레드: 번역이 끝난 시트를 대기열에서 꺼내 서식과 함께 출력 워크북에 기록
+        
+        번역(네트워크 대기)과 서식 복사(CPU 작업)를 겹쳐서 수행하기 위해
+        별도 스레드 하나에서 실행됩니다. None을 받으면 종료합니다.
+        
+        Args:
+            output_wb: 출력 워크북 (openpyxl 쓰기 전용)
+            write_queue: (시트 이름, 원본 워크시트, 번역된 DataFrame) 대기열
+        """
+        style_cache = {}  # 원본/출력 워크북이 같으므로 시트 간에 스타일 인덱스 대응을 공유
+        while True:
+            item = write_queue.get()
+            if item is None:
+                return
+            
+            sheet_name, source_ws, translated_df = item
+            write_start_time = datetime.now()
+            
+            # 새 시트 생성 후 번역된 데이터와 서식 복사
+            output_ws = output_wb.create_sheet(title=sheet_name)
+            logger.debug(f"시트 '{sheet_name}' 저장 시작 (서식 복사 포함)")
+            self._copy_sheet_with_formatting(source_ws, output_ws, translated_df, sheet_name, style_cache)
+            
+            write_duration = (datetime.now() - write_start_time).total_seconds()
+            logger.info(f"시트 '{sheet_name}' 저장 완료 (소요 시간: {write_duration:.2f}초)")
+    
+    def _put_for_writer(self, write_queue: queue.Queue, writer_future, item) -> bool:
+        """
+        저장 대기열에 항목 추가 (대기열이 가득 차면 저장 스레드가 비울 때까지 대기)
+        
+        Args:
+            write_queue: 저장 대기열
+            writer_future: 저장 스레드의 Future
+            item: 추가할 항목 (None이면 종료 신호)
+            
+        Returns:
+            추가 성공 여부 (저장 스레드가 이미 종료되었으면 False)
+        """
+        while not writer_future.done():
+            try:
+                write_queue.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def _detect_source_language(self, texts):
+        """
+        번역 대상 문자열 표본으로 원본 언어를 한 번 감지하여 self.src_lang에 저장
+        
+        긴 문자열 SRC_DETECT_SAMPLE_SIZE개를 한 요청으로 묶어(최대 SRC_DETECT_MAX_CHARS자) 감지하므로
+        섞여 있는 언어 중 가장 많은 언어가 선택됩니다. 이후 요청은 src를 지정하여 서버의 언어 감지를 생략합니다.
+        감지에 실패하거나 신뢰도가 낮으면 'auto'(요청마다 자동 감지)로 둡니다.
+        
+        Args:
+            texts: 번역 대상 문자열 목록
+        """
+        self.src_lang = 'auto'
+        sample = "\n".join(heapq.nlargest(SRC_DETECT_SAMPLE_SIZE, texts, key=len))[:SRC_DETECT_MAX_CHARS]
+        
+        self._rate_limiter.acquire()
+        try:
+            detected = self.translator.detect(sample)
+            self._rate_limiter.on_success()
+        except Exception as e:
+            # 요청 속도는 번역 요청과 같은 기준으로 일시적 오류(타임아웃, 429 등)일 때만 낮춤
+            if _is_recoverable(e):
+                self._rate_limiter.on_error()
+            logger.warning(f"원본 언어 감지 실패, 요청마다 자동 감지: {str(e)}")
+            return
+        
+        # googletrans는 신뢰도를 주지 않는 경우가 있음 (None이면 감지 결과를 그대로 사용)
+        lang, confidence = detected.lang, detected.confidence
+        if not isinstance(lang, str) or lang in ('auto', 'ko'):
+            logger.info(f"원본 언어를 특정할 수 없음 (감지 결과: {lang}), 요청마다 자동 감지")
+        elif confidence is not None and confidence < SRC_DETECT_MIN_CONFIDENCE:
+            logger.info(f"원본 언어 감지 신뢰도 낮음 ({lang}, {confidence:.2f}), 요청마다 자동 감지")
+        else:
+            self.src_lang = lang
+            logger.info(f"원본 언어 감지: {lang} (신뢰도: {confidence})")
+    
+    def _prefetch_translations(self, sheet_frames: dict, source_wb=None) -> tuple:
+        """
+        워크북 전체의 번역 대상 고유 문자열을 한 번에 번역하여 캐시에 저장
+        
+        여러 시트에 반복되는 문자열(공통 코드값, 상태값 등)은 한 번만 요청됩니다.
+        헤더도 같은 요청에 포함하므로 시트별 헤더 번역은 캐시에서 바로 처리됩니다.
+        카운터는 건드리지 않으며, 셀 단위 집계는 translate_dataframe에서 수행합니다.
+        
+        Args:
+            sheet_frames: {시트 이름: DataFrame}
+            source_wb: 원본 워크북 (openpyxl, 헤더 날짜 형식 확인용)
+            
+        Returns:
+            ({시트 이름: 헤더 문자열 목록}, {시트 이름: 컬럼별 번역 대상}, {원문: 번역문}) 튜플
+            (translate_dataframe에 넘겨 선택과 캐시 조회를 다시 하지 않도록 함)
+        """
+        all_strings = {}  # {원문: 셀 수} (순서 유지, 진행률 계산에도 사용)
+        sheet_headers = {}
+        sheet_targets = {}
+        total = 0
+        for sheet_name, df in sheet_frames.items():
+            total += len(df) * len(df.columns)
+            source_ws = source_wb[sheet_name] if source_wb is not None else None
+            sheet_headers[sheet_name] = self._header_texts(list(df.columns), source_ws)
+            sheet_targets[sheet_name] = self._select_column_targets(df, sheet_name)
+            for _, _, texts, _ in sheet_targets[sheet_name]:
+                for text_str in texts:
+                    all_strings[text_str] = all_strings.get(text_str, 0) + 1
+        
+        # 헤더는 숫자/기호만 있어도 번역하므로 빈 값과 한국어만 제외 (_translate_header_cell과 같은 기준)
+        # (헤더 셀은 진행률 계산의 전체 셀 수에 들어가지 않으므로 셀 수 0으로 추가)
+        header_strings = {
+            text_str.strip(): 0
+            for header_texts in sheet_headers.values() for text_str in header_texts
+            if text_str and text_str.strip() and not _HANGUL_RE.search(text_str.strip(), 0, 20)
+        }
+        for text_str in header_strings:
+            all_strings.setdefault(text_str, 0)
+        
+        logger.info(f"유니크 문자열 수: {len(all_strings)} (헤더 {len(header_strings)}개 포함) / 총 셀: {total}")
+        print(f"워크북 전체 고유 문자열 {len(all_strings)}개 번역 중... (총 셀: {total})")
+        
+        translations = {}
+        self._prefetch_failed = set()
+        if all_strings:
+            self._detect_source_language(all_strings)
+            
+            # 실패한 문자열은 여기서 한 번만 오류로 집계하고, 시트마다 다시 요청하지 않도록 기록
+            # (요청 제한에 걸린 상황에서 시트 수만큼 요청이 늘어나지 않도록 원문 유지)
+            translations = self._translate_batch(list(all_strings), cell_counts=all_strings)
+            self._prefetch_failed = set(all_strings) - translations.keys()
+            if self._prefetch_failed:
+                logger.warning(f"워크북 사전 번역 실패 문자열 {len(self._prefetch_failed)}개는 원문 유지")
+        return sheet_headers, sheet_targets, translations
+    
+    def _translate_sheets(self, input_file: str, sheet_names: list, sheet_cell_estimates: dict,
+                          source_wb, write_queue: queue.Queue, writer_future):
+        """
+        생산자: 시트를 차례로 번역하여 저장 대기열에 넘김
+        
+        모든 시트를 먼저 읽어 워크북 전체의 고유 문자열을 한 번에 번역한 뒤,
+        시트별로는 캐시된 번역 결과만 매핑합니다.
+        
+        Args:
+            input_file: 입력 엑셀 파일 경로
+            sheet_names: 시트 이름 목록
+            sheet_cell_estimates: {시트 이름: 예상 셀 수}
+            source_wb: 원본 워크북 (openpyxl, 서식 유지 모드)
+            write_queue: 저장 대기열
+            writer_future: 저장 스레드의 Future
+        """
+        # 1차: 모든 시트 데이터 읽기
+        # 서식용으로 이미 읽은 원본 워크북에서 값을 꺼내 파일을 다시 파싱하지 않음
+        logger.debug("시트 데이터 읽기 시작")
+        try:
+            read_frames = {}
+            formula_sheets = []
+            for sheet_name in sheet_names:
+                if _has_formulas(source_wb[sheet_name]):
+                    formula_sheets.append(sheet_name)
+                else:
+                    read_frames[sheet_name] = _sheet_to_dataframe(source_wb[sheet_name])
+            
+            # 원본 워크북은 출력에 수식을 그대로 옮기기 위해 수식 모드로 열었으므로
+            # 수식이 있는 시트만 저장된 계산 값을 읽기 전용 모드로 다시 읽음
+            if formula_sheets:
+                logger.debug(f"수식이 있는 시트의 계산 값 읽기: {formula_sheets}")
+                values_wb = load_workbook(input_file, read_only=True, data_only=True)
+                try:
+                    for sheet_name in formula_sheets:
+                        read_frames[sheet_name] = _sheet_to_dataframe(values_wb[sheet_name])
+                finally:
+                    values_wb.close()
+        except Exception as e:
+            logger.error(f"시트 데이터 읽기 중 오류: {str(e)}")
+            raise
+        
+        sheet_frames = {}
+        for sheet_name in sheet_names:
+            df = read_frames[sheet_name]
+            logger.info(f"시트 '{sheet_name}' 읽기 완료 (행: {len(df)}, 열: {len(df.columns)})")
+            
+            # 예상 셀 수를 실제 데이터 크기로 보정 (빈 행/열 제외분 반영)
+            self.total_cells_to_process += len(df) * len(df.columns) - sheet_cell_estimates[sheet_name]
+            sheet_frames[sheet_name] = df
+        
+        # 워크북 전체의 고유 문자열을 한 번에 번역 (시트 간 중복 문자열은 한 번만 요청)
+        sheet_headers, sheet_targets, prefetched = self._prefetch_translations(sheet_frames, source_wb)
+        
+        # 2차: 시트별 번역 결과 매핑 (캐시 사용, 추가 요청 없음)
+        for sheet_idx, sheet_name in enumerate(sheet_names, 1):
+            # 중지 플래그 확인
+            if self.should_stop:
+                logger.warning(f"번역 중지 요청됨 (시트: {sheet_name})")
+                raise InterruptedError("번역이 사용자에 의해 중지되었습니다.")
+            
+            sheet_start_time = datetime.now()
+            logger.info(f"[{sheet_idx}/{len(sheet_names)}] 시트 '{sheet_name}' 처리 시작")
+            print(f"\n시트 '{sheet_name}' 처리 중...")
+            
+            try:
+                source_ws = source_wb[sheet_name]
+                df = sheet_frames.pop(sheet_name)  # 저장 후 메모리 해제되도록 참조 제거
+                print(f"  행 수: {len(df)}, 열 수: {len(df.columns)}")
+                
+                # 번역 (원본 워크시트 전달하여 날짜 형식 확인)
+                translated_df = self.translate_dataframe(df, sheet_name=sheet_name, source_ws=source_ws,
+                                                         column_targets=sheet_targets.pop(sheet_name),
+                                                         header_texts=sheet_headers.pop(sheet_name),
+                                                         prefetched=prefetched)
+                
+                # 저장 스레드로 넘기고 바로 다음 시트 번역 진행
+                if not self._put_for_writer(write_queue, writer_future, (sheet_name, source_ws, translated_df)):
+                    writer_future.result()  # 저장 스레드 오류 전파
+                
+                sheet_duration = (datetime.now() - sheet_start_time).total_seconds()
+                logger.info(f"시트 '{sheet_name}' 번역 완료 (소요 시간: {sheet_duration:.2f}초)")
+                print(f"  시트 '{sheet_name}' 번역 완료")
+                
+            except InterruptedError:
+                # 중지 요청은 예외로 전파하여 상위에서 처리
+                raise
+            except Exception as e:
+                logger.error(f"시트 '{sheet_name}' 처리 중 오류: {str(e)}")
+                raise
+    
     def translate_excel(self, input_file: str, output_file: str = None):
         """
         엑셀 파일을 번역하여 새 파일로 저장
@@ -620,82 +1709,59 @@ class ExcelTranslator:
             print(f"출력 파일: {output_file}")
             print("-" * 50)
             
-            # 엑셀 파일 읽기 (모든 시트 포함)
+            # 엑셀 파일 열기 (읽기 전용 모드, 시트 목록과 크기 정보만 사용)
             logger.debug("엑셀 파일 열기 시작")
             try:
-                excel_file = pd.ExcelFile(input_file)
-                sheet_names = excel_file.sheet_names
-                logger.info(f"엑셀 파일 열기 성공, 시트 수: {len(sheet_names)}")
-                logger.debug(f"시트 목록: {sheet_names}")
+                size_wb = load_workbook(input_file, read_only=True)
             except Exception as e:
-                logger.error(f"엑셀 파일 읽기 실패: {str(e)}", exc_info=True)
+                logger.error(f"엑셀 파일 읽기 실패: {str(e)}")
                 raise
             
-            print(f"총 {len(sheet_names)}개의 시트를 발견했습니다.")
-            
-            # 전체 셀 수 계산 (진행률 계산용)
-            total_cells_count = 0
-            for sheet_name in sheet_names:
-                df_temp = pd.read_excel(excel_file, sheet_name=sheet_name)
-                total_cells_count += len(df_temp) * len(df_temp.columns)
+            try:
+                sheet_names = size_wb.sheetnames
+                logger.info(f"엑셀 파일 열기 성공, 시트 수: {len(sheet_names)}")
+                logger.debug(f"시트 목록: {sheet_names}")
+                print(f"총 {len(sheet_names)}개의 시트를 발견했습니다.")
+                
+                # 전체 셀 수 계산 (진행률 계산용)
+                # 시트 내용을 파싱하지 않고 시트 크기만 확인
+                sheet_cell_estimates = self._estimate_sheet_cells(size_wb, sheet_names)
+            finally:
+                size_wb.close()
+            total_cells_count = sum(sheet_cell_estimates.values())
             self.total_cells_to_process = total_cells_count
             logger.info(f"전체 처리할 셀 수: {total_cells_count}")
             
             # 진행률 초기화
             if self.progress_callback:
                 self.progress_callback(0, total_cells_count, "파일 분석 완료, 번역 시작...")
-                self.last_progress_update = datetime.now()
+                self._last_tick = time.monotonic()
             
-            # openpyxl로 원본 파일 열기 (서식 유지를 위해)
+            # openpyxl로 원본 파일 열기 (서식 유지를 위해, 번역 범위 밖의 수식은 그대로 출력)
             logger.debug("원본 파일을 openpyxl로 열기 시작")
             source_wb = load_workbook(input_file)
             logger.info("원본 파일 열기 완료 (서식 유지 모드)")
             
             # 새 워크북 생성 (출력용)
-            from openpyxl import Workbook
-            output_wb = Workbook()
-            output_wb.remove(output_wb.active)  # 기본 시트 제거
+            # 쓰기 전용 모드: 시트 전체를 셀 객체로 들고 있지 않고 행 단위로 임시 파일에 기록
+            output_wb = Workbook(write_only=True)
             
-            # ExcelWriter로 모든 시트를 번역하여 저장
-            for sheet_idx, sheet_name in enumerate(sheet_names, 1):
-                # 중지 플래그 확인
-                if self.should_stop:
-                    logger.warning(f"번역 중지 요청됨 (시트: {sheet_name})")
-                    raise InterruptedError("번역이 사용자에 의해 중지되었습니다.")
-                
-                sheet_start_time = datetime.now()
-                logger.info(f"[{sheet_idx}/{len(sheet_names)}] 시트 '{sheet_name}' 처리 시작")
-                print(f"\n시트 '{sheet_name}' 처리 중...")
-                
-                try:
-                    # 원본 시트와 데이터 읽기
-                    logger.debug(f"시트 '{sheet_name}' 읽기 시작")
-                    source_ws = source_wb[sheet_name]
-                    df = pd.read_excel(excel_file, sheet_name=sheet_name)
-                    logger.info(f"시트 '{sheet_name}' 읽기 완료 (행: {len(df)}, 열: {len(df.columns)})")
-                    print(f"  행 수: {len(df)}, 열 수: {len(df.columns)}")
-                    
-                    # 번역 (원본 워크시트 전달하여 날짜 형식 확인)
-                    translated_df = self.translate_dataframe(df, sheet_name=sheet_name, source_ws=source_ws)
-                    
-                    # 새 시트 생성
-                    output_ws = output_wb.create_sheet(title=sheet_name)
-                    
-                    # 번역된 데이터와 서식 복사
-                    logger.debug(f"시트 '{sheet_name}' 저장 시작 (서식 복사 포함)")
-                    self._copy_sheet_with_formatting(source_ws, output_ws, translated_df, sheet_name)
-                    
-                    sheet_duration = (datetime.now() - sheet_start_time).total_seconds()
-                    logger.info(f"시트 '{sheet_name}' 처리 완료 (소요 시간: {sheet_duration:.2f}초)")
-                    print(f"  시트 '{sheet_name}' 번역 완료")
-                    
-                except InterruptedError:
-                    # 중지 요청은 예외로 전파하여 상위에서 처리
-                    raise
-                except Exception as e:
-                    logger.error(f"시트 '{sheet_name}' 처리 중 오류: {str(e)}", exc_info=True)
-                    logger.debug(f"스택 트레이스:\n{traceback.format_exc()}")
-                    raise
+            # 저장 스레드 시작: 메인 스레드가 다음 시트를 번역하는 동안
+            # 번역이 끝난 시트는 저장 스레드에서 서식과 함께 기록
+            write_queue = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+            write_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="writer")
+            writer_future = write_pool.submit(self._write_sheets, output_wb, write_queue)
+            
+            try:
+                self._translate_sheets(input_file, sheet_names, sheet_cell_estimates,
+                                       source_wb, write_queue, writer_future)
+            finally:
+                # 종료 신호 전달 후 남은 시트 저장이 끝날 때까지 대기
+                self._put_for_writer(write_queue, writer_future, None)
+                write_pool.shutdown(wait=True)
+            
+            # 저장 스레드에서 발생한 오류 전파
+            writer_future.result()
             
             # 워크북 저장
             logger.debug("번역된 파일 저장 시작")
@@ -713,6 +1779,11 @@ class ExcelTranslator:
             logger.info(f"번역된 셀 수: {self.translated_count}")
             logger.info(f"건너뛴 셀 수: {self.skipped_count}")
             logger.info(f"번역 오류 수: {self.error_count}")
+            cache_info = self.cache_info()
+            logger.info(
+                f"번역 캐시: 적중 {cache_info['hits']}회, API로 번역한 문자열 {cache_info['misses']}개, "
+                f"저장된 번역 {cache_info['size']}개"
+            )
             logger.info(f"출력 파일: {output_file}")
             
             print("\n" + "=" * 50)
@@ -734,9 +1805,13 @@ class ExcelTranslator:
                 raise  # 상위로 전파하여 GUI에서 처리
             
         except Exception as e:
+            # 하위 단계에서는 메시지만 남기고 스택 트레이스는 여기서 한 번만 기록
             logger.critical(f"치명적 오류 발생: {str(e)}", exc_info=True)
-            logger.debug(f"전체 스택 트레이스:\n{traceback.format_exc()}")
             raise
+        
+        finally:
+            # 번역 요청용 스레드 풀 정리
+            self._shutdown_executor()
 
 
 def main():
@@ -766,7 +1841,6 @@ def main():
         sys.exit(130)
     except Exception as e:
         logger.critical(f"프로그램 오류: {str(e)}", exc_info=True)
-        logger.debug(f"전체 스택 트레이스:\n{traceback.format_exc()}")
         print(f"\n오류 발생: {str(e)}")
         print(f"상세 로그는 logs 폴더를 확인하세요.")
         sys.exit(1)
@@ -0,0 +1,167 @@
+"""
+번역 결과 캐시 모듈
+SQLite 파일에 원문별 번역문을 저장하여 다음 실행(또는 중지 후 재실행)에서도 재사용하고,
+실행 중에는 크기가 제한된 메모리 캐시로 같은 문자열을 다시 조회하지 않음
+"""
+
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+
+
+# SQLite 한 쿼리에 넣을 수 있는 변수 개수 제한(기본 999)보다 작게 나누어 조회
+_QUERY_BATCH_SIZE = 500
+
+
+class TranslationCache:
+    """
+    SQLite 기반 번역 캐시 (여러 스레드에서 공유 가능)
+    
+    키는 원문의 blake2b 해시(16바이트)이므로 긴 문자열도 고정 길이로 저장됩니다.
+    """
+    
+    def __init__(self, db_path: str = "translations.db"):
+        """
+        캐시 파일 열기 (없으면 생성)
+        
+        Args:
+            db_path: SQLite 파일 경로
+        """
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        with self._lock:
+            self._conn.execute("CREATE TABLE IF NOT EXISTS tr (k TEXT PRIMARY KEY, v TEXT)")
+            self._conn.commit()
+    
+    @staticmethod
+    def _key(text: str) -> str:
+        """원문 해시 키 생성"""
+        return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+    
+    def get_many(self, texts: list) -> dict:
+        """
+        여러 원문의 번역문을 한 번에 조회
+        
+        Args:
+            texts: 원문 목록
+        
+        Returns:
+            {원문: 번역문} 딕셔너리 (캐시에 있는 원문만 포함)
+        """
+        keys = {self._key(text): text for text in texts}
+        key_list = list(keys)
+        found = {}
+        with self._lock:
+            for start in range(0, len(key_list), _QUERY_BATCH_SIZE):
+                batch = key_list[start:start + _QUERY_BATCH_SIZE]
+                placeholders = ",".join("?" * len(batch))
+                for key, value in self._conn.execute(f"SELECT k, v FROM tr WHERE k IN ({placeholders})", batch):
+                    found[keys[key]] = value
+        return found
+    
+    def get(self, text: str):
+        """
+        원문 하나의 번역문 조회
+        
+        Args:
+            text: 원문
+        
+        Returns:
+            번역문 (캐시에 없으면 None)
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT v FROM tr WHERE k = ?", (self._key(text),)).fetchone()
+        return row[0] if row else None
+    
+    def put_many(self, translations: dict):
+        """
+        여러 번역 결과를 한 번에 저장
+        
+        Args:
+            translations: {원문: 번역문} 딕셔너리
+        """
+        if not translations:
+            return
+        rows = [(self._key(text), value) for text, value in translations.items()]
+        with self._lock:
+            self._conn.executemany("INSERT OR REPLACE INTO tr (k, v) VALUES (?, ?)", rows)
+            self._conn.commit()
+    
+    def put(self, text: str, translated: str):
+        """
+        번역 결과 하나 저장
+        
+        Args:
+            text: 원문
+            translated: 번역문
+        """
+        self.put_many({text: translated})
+    
+    def close(self):
+        """캐시 파일 닫기"""
+        with self._lock:
+            self._conn.close()
+
+
+class LRUTranslationCache:
+    """
+    크기가 제한된 메모리 번역 캐시 (가장 오래 사용하지 않은 항목부터 제거, 여러 스레드에서 공유 가능)
+    
+    dict와 같은 방식(get, update, [원문] = 번역문, len)으로 사용합니다.
+    """
+    
+    def __init__(self, max_entries: int = 50000):
+        """
+        캐시 초기화
+        
+        Args:
+            max_entries: 최대 항목 수
+        """
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+    
+    def get(self, text: str, default=None):
+        """
+        원문의 번역문 조회 (조회한 항목은 가장 최근 사용으로 표시)
+        
+        Args:
+            text: 원문
+            default: 캐시에 없을 때 반환할 값
+        
+        Returns:
+            번역문 (캐시에 없으면 default)
+        """
+        with self._lock:
+            translated = self._entries.get(text)
+            if translated is None:
+                return default
+            self._entries.move_to_end(text)
+            return translated
+    
+    def update(self, translations: dict):
+        """
+        여러 번역 결과 저장 (최대 항목 수를 넘으면 오래된 항목 제거)
+        
+        Args:
+            translations: {원문: 번역문} 딕셔너리
+        """
+        with self._lock:
+            self._entries.update(translations)
+            for text in translations:
+                self._entries.move_to_end(text)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def __setitem__(self, text: str, translated: str):
+        self.update({text: translated})
+    
+    def __len__(self):
+        return len(self._entries)
+    
+    def clear(self):
+        """모든 항목 제거"""
+        with self._lock:
+            self._entries.clear()